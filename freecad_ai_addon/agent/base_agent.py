@@ -17,6 +17,8 @@ except ImportError:
     App = None
     Gui = None
 
+from freecad_ai_addon.utils.compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,7 +56,7 @@ class TaskResult:
     execution_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentTask:
     """Task definition for agents"""
 
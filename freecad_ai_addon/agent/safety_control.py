@@ -7,7 +7,8 @@ from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 
 try:
     import FreeCAD as App
@@ -26,6 +27,7 @@ except ImportError:
     QMessageBox = None
     QDialog = None
 
+from freecad_ai_addon.utils.compat import DATACLASS_SLOTS
 from .base_agent import AgentTask
 
 logger = logging.getLogger(__name__)
@@ -63,7 +65,7 @@ class SafetyConstraint:
     fix_function: Optional[Callable] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResourceLimit:
     """Resource usage limits"""
 
@@ -73,7 +75,7 @@ class ResourceLimit:
     max_operations_per_minute: int = 60
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SafetyCheckResult:
     """Result of safety check"""
 
@@ -272,7 +274,8 @@ class AgentSafetyController:
 
         # Resource monitoring
         self.operations_count = 0
-        self.operations_start_time = datetime.now()
+        # Monotonic seconds; only used to measure the rate-limit window
+        self.operations_start_time = time.monotonic()
 
         self.logger = logging.getLogger(f"{__name__}.AgentSafetyController")
 
@@ -539,9 +542,10 @@ class AgentSafetyController:
     def check_resource_limits(self, task: AgentTask) -> bool:
         """Check if operation would exceed resource limits"""
         # Reset counter if more than a minute has passed
-        if datetime.now() - self.operations_start_time > timedelta(minutes=1):
+        now = time.monotonic()
+        if now - self.operations_start_time > 60.0:
             self.operations_count = 0
-            self.operations_start_time = datetime.now()
+            self.operations_start_time = now
 
         # Check operation rate limit
         if self.operations_count >= self.resource_limits.max_operations_per_minute:
@@ -644,8 +644,7 @@ def get_provider_manager() -> ProviderManager:
     """
     global _provider_manager
     if _provider_manager is None:
-        from freecad_ai_addon.utils.config import ConfigManager
+        from freecad_ai_addon.utils.config import get_config_manager
 
-        config_manager = ConfigManager()
-        _provider_manager = ProviderManager(config_manager)
+        _provider_manager = ProviderManager(get_config_manager())
     return _provider_manager
@@ -5,8 +5,13 @@ Manages real-time status of AI providers and their connections.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
 import time
-from typing import Dict, Optional, Any, Callable
+import weakref
+from typing import Dict, List, Optional, Any, Callable, Coroutine
 from enum import Enum
 from dataclasses import dataclass
 
@@ -28,6 +33,15 @@ class ProviderStatus(Enum):
     EXPIRED = "expired"
 
 
+# Statuses that make adaptive monitoring poll at its shortest interval
+_FAILURE_STATUSES = frozenset(
+    {ProviderStatus.ERROR, ProviderStatus.RATE_LIMITED, ProviderStatus.EXPIRED}
+)
+
+# All-connected cycles required before adaptive monitoring backs off
+_STABLE_CYCLES_BEFORE_BACKOFF = 3
+
+
 @dataclass
 class ProviderHealth:
     """Provider health information"""
@@ -40,6 +54,31 @@ class ProviderHealth:
     rate_limit_reset: Optional[float]
     usage_stats: Dict[str, Any]
 
+    def formatted_usage_stats(self) -> List[str]:
+        """
+        Format usage statistics for display
+
+        Returns:
+            Lines such as "Models Available: 12"
+        """
+        return [
+            f"{_usage_stat_label(key)}: {value}"
+            for key, value in self.usage_stats.items()
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _usage_stat_label(key: str) -> str:
+    """Turn a usage stat key like "models_available" into a display label"""
+    return key.replace("_", " ").title()
+
+
+def _callback_ref(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """Reference a callback, weakly if it is a bound method"""
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
 
 class ProviderMonitor:
     """Monitors provider status and connection health"""
@@ -55,6 +94,7 @@ class ProviderMonitor:
         self._status_callbacks: Dict[str, list[Callable]] = {}
         self._monitoring_active = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._interval = 60.0
 
         logger.info("Provider monitor initialized")
 
@@ -64,13 +104,16 @@ class ProviderMonitor:
         """
         Register a callback for provider status changes
 
+        Bound methods are held weakly, so a subscriber that is garbage
+        collected without unregistering is dropped automatically.
+
         Args:
             provider: Provider name
             callback: Function to call when status changes
         """
         if provider not in self._status_callbacks:
             self._status_callbacks[provider] = []
-        self._status_callbacks[provider].append(callback)
+        self._status_callbacks[provider].append(_callback_ref(callback))
         logger.debug("Registered status callback for provider %s", provider)
 
     def unregister_status_callback(
@@ -84,13 +127,17 @@ class ProviderMonitor:
             callback: Callback function to remove
         """
         if provider in self._status_callbacks:
-            try:
-                self._status_callbacks[provider].remove(callback)
-                if not self._status_callbacks[provider]:
-                    del self._status_callbacks[provider]
-                logger.debug("Unregistered status callback for provider %s", provider)
-            except ValueError:
-                logger.warning("Callback not found for provider %s", provider)
+            refs = self._status_callbacks[provider]
+            for ref in refs:
+                if ref() == callback:
+                    refs.remove(ref)
+                    if not refs:
+                        del self._status_callbacks[provider]
+                    logger.debug(
+                        "Unregistered status callback for provider %s", provider
+                    )
+                    return
+            logger.warning("Callback not found for provider %s", provider)
 
     def get_provider_status(self, provider: str) -> ProviderHealth:
         """
@@ -422,7 +469,13 @@ class ProviderMonitor:
     async def _notify_status_callbacks(self, provider: str, health: ProviderHealth):
         """Notify registered callbacks of status changes"""
         if provider in self._status_callbacks:
-            for callback in self._status_callbacks[provider]:
+            refs = self._status_callbacks[provider]
+            for ref in list(refs):
+                callback = ref()
+                if callback is None:
+                    # Subscriber was garbage collected without unregistering
+                    refs.remove(ref)
+                    continue
                 try:
                     if asyncio.iscoroutinefunction(callback):
                         await callback(health)
@@ -431,40 +484,110 @@ class ProviderMonitor:
                 except Exception as e:
                     logger.error("Error in status callback: %s", str(e))
 
-    async def start_monitoring(self, interval: float = 60.0):
+    async def start_monitoring(
+        self,
+        interval: float = 60.0,
+        adaptive: bool = False,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+    ):
         """
         Start continuous monitoring of all configured providers
 
         Args:
             interval: Check interval in seconds
+            adaptive: Adjust the interval to the observed provider health
+            min_interval: Interval used after an error when adaptive
+            max_interval: Upper bound for backing off when adaptive
         """
         if self._monitoring_active:
             logger.warning("Monitoring already active")
             return
 
         self._monitoring_active = True
+        self._interval = interval
         logger.info("Starting provider monitoring with %ss interval", interval)
 
         async def monitor_loop():
+            stable_cycles = 0
             while self._monitoring_active:
                 try:
+                    if self.credential_manager is None:
+                        self.credential_manager = get_credential_manager()
                     providers = self.credential_manager.list_providers()
                     tasks = [
                         self.check_provider_connection(provider)
                         for provider in providers
                     ]
                     if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
-
-                    await asyncio.sleep(interval)
+                        results = await asyncio.gather(*tasks, return_exceptions=True)
+                        if adaptive:
+                            stable_cycles = self._adapt_interval(
+                                results,
+                                stable_cycles,
+                                interval,
+                                min_interval,
+                                max_interval,
+                            )
+
+                    await asyncio.sleep(self._interval)
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
                     logger.error("Error in monitoring loop: %s", str(e))
-                    await asyncio.sleep(interval)
+                    await asyncio.sleep(self._interval)
 
         self._monitor_task = asyncio.create_task(monitor_loop())
 
+    def set_interval(self, interval: float):
+        """
+        Change the monitoring interval, effective after the current sleep
+
+        Args:
+            interval: Check interval in seconds
+        """
+        if interval != self._interval:
+            logger.debug("Provider monitoring interval set to %ss", interval)
+        self._interval = interval
+
+    def _adapt_interval(
+        self,
+        results: list,
+        stable_cycles: int,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+    ) -> int:
+        """
+        Tighten polling after failures and back off while all is healthy
+
+        Args:
+            results: Health results (or exceptions) of the last cycle
+            stable_cycles: Consecutive all-connected cycles so far
+            base_interval: Interval requested by the caller
+            min_interval: Interval used after a failure
+            max_interval: Upper bound for backing off
+
+        Returns:
+            Updated number of consecutive all-connected cycles
+        """
+        statuses = [
+            r.status if isinstance(r, ProviderHealth) else ProviderStatus.ERROR
+            for r in results
+        ]
+        if any(s in _FAILURE_STATUSES for s in statuses):
+            self.set_interval(min_interval)
+            return 0
+        if all(s == ProviderStatus.CONNECTED for s in statuses):
+            stable_cycles += 1
+            if stable_cycles >= _STABLE_CYCLES_BEFORE_BACKOFF:
+                self.set_interval(min(self._interval * 2, max_interval))
+            else:
+                self.set_interval(max(self._interval, base_interval))
+            return stable_cycles
+        self.set_interval(base_interval)
+        return 0
+
     async def stop_monitoring(self):
         """Stop continuous monitoring"""
         if not self._monitoring_active:
@@ -497,3 +620,45 @@ def get_provider_monitor() -> ProviderMonitor:
     if _provider_monitor is None:
         _provider_monitor = ProviderMonitor()
     return _provider_monitor
+
+
+# Event loop running monitor coroutines for GUI callers
+_monitor_loop: Optional[asyncio.AbstractEventLoop] = None
+_monitor_loop_lock = threading.Lock()
+
+
+def get_monitor_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop used to run provider monitoring coroutines
+
+    FreeCAD owns the Qt event loop, so the GUI cannot simply call
+    ``asyncio.create_task``. Instead a single asyncio loop is started on
+    first use in a daemon thread and kept for the lifetime of the process,
+    so monitoring tasks and connection checks share one loop.
+
+    Returns:
+        Running asyncio event loop
+    """
+    global _monitor_loop
+    with _monitor_loop_lock:
+        if _monitor_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="ProviderMonitorLoop", daemon=True
+            )
+            thread.start()
+            _monitor_loop = loop
+    return _monitor_loop
+
+
+def run_in_monitor_loop(coro: Coroutine) -> concurrent.futures.Future:
+    """
+    Schedule a coroutine on the monitor event loop from any thread
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future resolving to the coroutine result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_monitor_loop())
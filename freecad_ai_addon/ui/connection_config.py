@@ -9,7 +9,7 @@ from freecad_ai_addon.core.connection_manager import (
     get_connection_manager,
     ConnectionConfig,
 )
-from freecad_ai_addon.utils.config import ConfigManager
+from freecad_ai_addon.utils.config import get_config_manager
 from freecad_ai_addon.utils.logging import get_logger
 
 logger = get_logger("connection_config")
@@ -21,7 +21,7 @@ class ConnectionConfigDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
         """Initialize the connection config dialog"""
         super().__init__(parent)
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.connection_manager = get_connection_manager()
 
         self.setWindowTitle("Connection Management Settings")
@@ -5,9 +5,12 @@ Implements code execution buttons, parameter widgets, preview functionality,
 and other interactive elements for the AI conversation interface.
 """
 
+import ast
+import functools
 import re
+import time
 import traceback
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,10 +32,11 @@ try:
         QDoubleSpinBox,
         QComboBox,
         QCheckBox,
-        QTextEdit,
+        QPlainTextEdit,
         QMessageBox,
         QFrame,
         QGroupBox,
+        QFormLayout,
         QFont,
     )  # type: ignore
 except Exception:
@@ -49,10 +53,11 @@ except Exception:
             QDoubleSpinBox,
             QComboBox,
             QCheckBox,
-            QTextEdit,
+            QPlainTextEdit,
             QMessageBox,
             QFrame,
             QGroupBox,
+            QFormLayout,
         )  # type: ignore
         from PySide2.QtGui import QFont  # type: ignore
 
@@ -72,10 +77,11 @@ except Exception:
             QDoubleSpinBox,
             QComboBox,
             QCheckBox,
-            QTextEdit,
+            QPlainTextEdit,
             QMessageBox,
             QFrame,
             QGroupBox,
+            QFormLayout,
         )
         from PySide6.QtGui import QFont
 
@@ -89,10 +95,81 @@ except ImportError:
     App = None
     Gui = None
 
+from freecad_ai_addon.utils.compat import DATACLASS_SLOTS
 from freecad_ai_addon.utils.logging import get_logger
 
 logger = get_logger("interactive_elements")
 
+# Immutable part of the code execution namespace, copied per run
+_BASE_EXEC_GLOBALS = {"App": App, "Gui": Gui, "__builtins__": __builtins__}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_range(range_str: str) -> Dict[str, Any]:
+    """Parse a ``key=value, ...`` range hint into a dict without executing it.
+
+    The hint is parsed as the argument list of a ``dict(...)`` call and each
+    keyword value is evaluated with ``ast.literal_eval``, so only literals
+    are accepted. Repeated keywords are rejected, as ``dict(...)`` would.
+    Malformed hints raise ValueError or SyntaxError.
+    """
+    tree = ast.parse(f"dict({range_str})", mode="eval")
+    call = tree.body
+    if not isinstance(call, ast.Call) or call.args:
+        raise ValueError(f"Invalid range specification: {range_str!r}")
+
+    range_info = {}
+    for keyword in call.keywords:
+        if keyword.arg is None or keyword.arg in range_info:
+            raise ValueError(f"Invalid range specification: {range_str!r}")
+        try:
+            range_info[keyword.arg] = ast.literal_eval(keyword.value)
+        except TypeError as e:  # e.g. an unhashable dict key or set item
+            raise ValueError(f"Invalid range specification: {range_str!r}") from e
+    return range_info
+
+
+@functools.lru_cache(maxsize=None)
+def _code_font() -> QFont:
+    """Shared monospace font for code displays (built once Qt is running)"""
+    return QFont("Consolas, Monaco, monospace", 9)
+
+
+@functools.lru_cache(maxsize=None)
+def _button_font() -> QFont:
+    """Shared bold font for execute buttons (built once Qt is running)"""
+    return QFont("", 9, QFont.Bold)
+
+
+_EXEC_CSS_GREEN = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+_CODE_DISPLAY_CSS = """
+    QPlainTextEdit {
+        background-color: #f8f8f8;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+    }
+"""
+
 
 class CodeExecutionStatus(Enum):
     """Status of code execution"""
@@ -104,19 +181,38 @@ class CodeExecutionStatus(Enum):
     PREVIEW = "preview"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExecutionResult:
     """Result of code execution"""
 
     status: CodeExecutionStatus
     output: Optional[str] = None
     error: Optional[str] = None
-    created_objects: List[str] = None
+    created_objects: Tuple[str, ...] = ()
     execution_time: float = 0.0
+    exception: Optional[BaseException] = None
+
+    @property
+    def traceback_text(self) -> Optional[str]:
+        """Formatted traceback of the failure, built only when requested"""
+        if self.exception is None:
+            return None
+        return "".join(
+            traceback.format_exception(
+                type(self.exception), self.exception, self.exception.__traceback__
+            )
+        )
+
+
+class _CreateTracker:
+    """Document observer recording the names of newly created objects"""
 
-    def __post_init__(self):
-        if self.created_objects is None:
-            self.created_objects = []
+    def __init__(self):
+        self.names: List[str] = []
+
+    def slotCreatedObject(self, obj):
+        """Called by FreeCAD whenever an object is added to a document"""
+        self.names.append(obj.Name)
 
 
 class CodeExecutionWorker(QThread):
@@ -141,48 +237,30 @@ class CodeExecutionWorker(QThread):
             return
 
         try:
-            import time
-
             start_time = time.time()
 
             self.progress.emit("Preparing execution environment...")
 
             # Create execution context
-            exec_globals = {
-                "App": App,
-                "Gui": Gui,
-                "__builtins__": __builtins__,
-                "created_objects": [],
-            }
+            exec_globals = _BASE_EXEC_GLOBALS.copy()
+            exec_globals["created_objects"] = []
 
-            # Add object tracking for preview mode
+            # Track object creation for preview mode via a document observer
+            tracker = None
             if self.preview_mode:
-                exec_globals["_preview_objects"] = []
-                # Monkey patch object creation for tracking
-                if App.ActiveDocument:
-                    original_add_object = App.ActiveDocument.addObject
-                else:
-                    original_add_object = None
-
-                def tracked_add_object(*args, **kwargs):
-                    if original_add_object:
-                        obj = original_add_object(*args, **kwargs)
-                        exec_globals["_preview_objects"].append(obj.Name)
-                        exec_globals["created_objects"].append(obj.Name)
-                        return obj
-                    return None
-
-                if App.ActiveDocument:
-                    App.ActiveDocument.addObject = tracked_add_object
+                tracker = _CreateTracker()
+                exec_globals["_preview_objects"] = tracker.names
+                App.addDocumentObserver(tracker)
 
             self.progress.emit("Executing code...")
 
             # Execute the code
-            exec(self.code, exec_globals)
-
-            # Restore original function if in preview mode
-            if self.preview_mode and App.ActiveDocument and original_add_object:
-                App.ActiveDocument.addObject = original_add_object
+            try:
+                exec(self.code, exec_globals)
+            finally:
+                if tracker is not None:
+                    App.removeDocumentObserver(tracker)
+                    exec_globals["created_objects"].extend(tracker.names)
 
             # Recompute document
             if App.ActiveDocument:
@@ -191,20 +269,25 @@ class CodeExecutionWorker(QThread):
             execution_time = time.time() - start_time
 
             self.result = ExecutionResult(
-                CodeExecutionStatus.SUCCESS,
+                (
+                    CodeExecutionStatus.PREVIEW
+                    if self.preview_mode
+                    else CodeExecutionStatus.SUCCESS
+                ),
                 output=f"Code executed successfully in {execution_time:.2f}s",
-                created_objects=exec_globals.get("created_objects", []),
+                created_objects=tuple(exec_globals.get("created_objects", ())),
                 execution_time=execution_time,
             )
 
-            if self.preview_mode:
-                self.result.status = CodeExecutionStatus.PREVIEW
-
         except Exception as e:
-            error_msg = f"Execution error: {str(e)}\n{traceback.format_exc()}"
-            logger.error(f"Code execution failed: {error_msg}")
+            # The traceback is only formatted if a log handler or the UI needs it
+            logger.error("Code execution failed: %s", e, exc_info=e)
 
-            self.result = ExecutionResult(CodeExecutionStatus.ERROR, error=error_msg)
+            self.result = ExecutionResult(
+                CodeExecutionStatus.ERROR,
+                error=f"Execution error: {str(e)}",
+                exception=e,
+            )
 
         self.finished.emit(self.result)
 
@@ -214,40 +297,38 @@ class ExecuteCodeButton(QPushButton):
 
     execution_finished = Signal(ExecutionResult)
 
+    # Fully built stylesheet per button state, keyed by state name
+    _QSS = {
+        state: _EXEC_CSS_GREEN.replace("#4CAF50", color)
+        for state, color in (
+            ("green", "#4CAF50"),
+            ("orange", "#FF9800"),
+            ("blue", "#2196F3"),
+            ("red", "#F44336"),
+        )
+    }
+
     def __init__(self, code_content: str, parent=None):
         super().__init__("Execute in FreeCAD", parent)
         self.code = code_content
         self.execution_worker = None
         self.preview_mode = False
+        self._qss_state = None
 
         self._setup_ui()
         self._connect_signals()
 
     def _setup_ui(self):
         """Set up button UI"""
-        self.setFont(QFont("", 9, QFont.Bold))
+        self.setFont(_button_font())
         self.setMinimumHeight(32)
-        self.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """
-        )
+        self._set_qss_state("green")
+
+    def _set_qss_state(self, state: str):
+        """Switch to a cached stylesheet, skipping no-op reassignments"""
+        if state != self._qss_state:
+            self._qss_state = state
+            self.setStyleSheet(self._QSS[state])
 
     def _connect_signals(self):
         """Connect button signals"""
@@ -258,10 +339,10 @@ class ExecuteCodeButton(QPushButton):
         self.preview_mode = preview
         if preview:
             self.setText("Preview Changes")
-            self.setStyleSheet(self.styleSheet().replace("#4CAF50", "#FF9800"))
+            self._set_qss_state("orange")
         else:
             self.setText("Execute in FreeCAD")
-            self.setStyleSheet(self.styleSheet().replace("#FF9800", "#4CAF50"))
+            self._set_qss_state("green")
 
     def execute_code(self):
         """Execute the code"""
@@ -305,16 +386,23 @@ class ExecuteCodeButton(QPushButton):
 
         if result.status == CodeExecutionStatus.SUCCESS:
             self.setText("✓ Executed")
-            self.setStyleSheet(self.styleSheet().replace("#4CAF50", "#2196F3"))
+            self._set_qss_state("blue")
         elif result.status == CodeExecutionStatus.PREVIEW:
             self.setText("✓ Previewed")
-            self.setStyleSheet(self.styleSheet().replace("#FF9800", "#2196F3"))
+            self._set_qss_state("blue")
         elif result.status == CodeExecutionStatus.ERROR:
             self.setText("✗ Error")
-            self.setStyleSheet(self.styleSheet().replace("#4CAF50", "#F44336"))
-
-            # Show error dialog
-            QMessageBox.critical(self, "Execution Error", result.error)
+            self._set_qss_state("red")
+
+            # Show error dialog, traceback behind the "Show Details..." button
+            error_box = QMessageBox(self)
+            error_box.setIcon(QMessageBox.Critical)
+            error_box.setWindowTitle("Execution Error")
+            error_box.setText(result.error)
+            details = result.traceback_text
+            if details:
+                error_box.setDetailedText(details)
+            error_box.exec()
 
         # Emit signal for parent handling
         self.execution_finished.emit(result)
@@ -326,10 +414,10 @@ class ExecuteCodeButton(QPushButton):
         """Reset button to initial state"""
         if self.preview_mode:
             self.setText("Preview Changes")
-            self.setStyleSheet(self.styleSheet().replace("#2196F3", "#FF9800"))
+            self._set_qss_state("orange")
         else:
             self.setText("Execute in FreeCAD")
-            self.setStyleSheet(self.styleSheet().replace("#2196F3", "#4CAF50"))
+            self._set_qss_state("green")
 
 
 class ParameterWidget(QWidget):
@@ -351,17 +439,20 @@ class ParameterWidget(QWidget):
         self.default_value = default_value
         self.range_info = range_info or {}
 
+        # Coalesce bursts of spinbox changes (wheel, arrow keys) into one emit
+        self._pending_value = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self._emit_pending_value)
+
         self._setup_ui()
 
     def _setup_ui(self):
         """Set up parameter widget UI"""
+        # The parameter name is shown by the enclosing form layout row
         layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-
-        # Parameter name label
-        name_label = QLabel(f"{self.param_name}:")
-        name_label.setMinimumWidth(80)
-        layout.addWidget(name_label)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # Create appropriate input widget based on type
         if self.param_type == "float":
@@ -390,9 +481,7 @@ class ParameterWidget(QWidget):
         if "step" in self.range_info:
             widget.setSingleStep(self.range_info["step"])
 
-        widget.valueChanged.connect(
-            lambda v: self.value_changed.emit(self.param_name, v)
-        )
+        widget.valueChanged.connect(self._schedule_emit)
         return widget
 
     def _create_int_widget(self):
@@ -405,11 +494,18 @@ class ParameterWidget(QWidget):
         if "max" in self.range_info:
             widget.setMaximum(self.range_info["max"])
 
-        widget.valueChanged.connect(
-            lambda v: self.value_changed.emit(self.param_name, v)
-        )
+        widget.valueChanged.connect(self._schedule_emit)
         return widget
 
+    def _schedule_emit(self, value):
+        """Remember the latest value and restart the debounce timer"""
+        self._pending_value = value
+        self._debounce.start()
+
+    def _emit_pending_value(self):
+        """Emit the last value seen during a burst of changes"""
+        self.value_changed.emit(self.param_name, self._pending_value)
+
     def _create_bool_widget(self):
         """Create boolean parameter widget"""
         widget = QCheckBox()
@@ -423,7 +519,8 @@ class ParameterWidget(QWidget):
         """Create choice parameter widget"""
         widget = QComboBox()
         choices = self.range_info.get("choices", [])
-        widget.addItems([str(choice) for choice in choices])
+        for choice in choices:
+            widget.addItem(str(choice))
 
         if self.default_value in choices:
             widget.setCurrentText(str(self.default_value))
@@ -475,26 +572,17 @@ class InteractiveCodeBlock(QFrame):
         layout.setSpacing(8)
 
         # Code display
-        code_display = QTextEdit()
+        code_display = QPlainTextEdit()
         code_display.setPlainText(self.code)
         code_display.setMaximumHeight(200)
-        code_display.setFont(QFont("Consolas, Monaco, monospace", 9))
-        code_display.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #f8f8f8;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        )
+        code_display.setFont(_code_font())
+        code_display.setStyleSheet(_CODE_DISPLAY_CSS)
         layout.addWidget(code_display)
 
         # Parameters section
         if self.parameters:
             params_group = QGroupBox("Parameters")
-            params_layout = QVBoxLayout(params_group)
+            params_layout = QFormLayout(params_group)
 
             self.param_widgets = {}
             for param_name, param_info in self.parameters.items():
@@ -505,7 +593,7 @@ class InteractiveCodeBlock(QFrame):
                     param_info.get("range", {}),
                 )
                 param_widget.value_changed.connect(self._on_parameter_changed)
-                params_layout.addWidget(param_widget)
+                params_layout.addRow(f"{param_name}:", param_widget)
                 self.param_widgets[param_name] = param_widget
 
             layout.addWidget(params_group)
@@ -552,7 +640,8 @@ class InteractiveCodeBlock(QFrame):
             range_info = {}
             if range_str:
                 try:
-                    range_info = eval(f"dict({range_str})")
+                    # Copy so callers can't mutate the cached entry
+                    range_info = dict(_parse_range(range_str))
                 except (ValueError, SyntaxError):
                     pass
 
@@ -667,9 +756,9 @@ class ConfirmationDialog(QMessageBox):
         # Main message
         message = f"This will {self.operation}."
         if self.affected_objects:
-            message += f"\n\nAffected objects ({len(self.affected_objects)}):"
-            for obj in self.affected_objects[:5]:  # Show first 5
-                message += f"\n• {obj}"
+            message += f"\n\nAffected objects ({len(self.affected_objects)}):\n"
+            # Show first 5
+            message += "\n".join(f"• {obj}" for obj in self.affected_objects[:5])
             if len(self.affected_objects) > 5:
                 message += f"\n• ... and {len(self.affected_objects) - 5} more"
 
@@ -684,35 +773,44 @@ class ConfirmationDialog(QMessageBox):
         self.setDefaultButton(self.button(QMessageBox.NoRole))
 
 
+# Pattern for fenced code blocks
+_FENCE_RE = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+
+
+def _iter_message_segments(text: str):
+    """Yield ``("text", str)`` and ``("code", dict)`` segments in order.
+
+    Walks the fenced code blocks with a single regex scan, emitting the
+    prose between them as text segments.
+    """
+    last_end = 0
+    for match in _FENCE_RE.finditer(text):
+        yield "text", text[last_end : match.start()]
+        yield "code", _make_code_block(match.group(1) or "", match.group(2))
+        last_end = match.end()
+    yield "text", text[last_end:]
+
+
+def _make_code_block(language: str, code: str) -> Dict[str, Any]:
+    """Describe a fenced code block and whether it can be executed"""
+    is_python = language.lower() in ["python", "py", ""]
+    has_freecad = "App." in code or "Gui." in code
+    if is_python and has_freecad:
+        return {
+            "language": language or "python",
+            "code": code.strip(),
+            "executable": True,
+        }
+    return {
+        "language": language or "text",
+        "code": code.strip(),
+        "executable": False,
+    }
+
+
 def extract_code_blocks(text: str) -> List[Dict[str, str]]:
     """Extract code blocks from markdown text"""
-    code_blocks = []
-
-    # Pattern for fenced code blocks
-    pattern = r"```(\w+)?\n(.*?)\n```"
-    matches = re.findall(pattern, text, re.DOTALL)
-
-    for language, code in matches:
-        is_python = language.lower() in ["python", "py", ""]
-        has_freecad = "App." in code or "Gui." in code
-        if is_python and has_freecad:
-            code_blocks.append(
-                {
-                    "language": language or "python",
-                    "code": code.strip(),
-                    "executable": True,
-                }
-            )
-        else:
-            code_blocks.append(
-                {
-                    "language": language or "text",
-                    "code": code.strip(),
-                    "executable": False,
-                }
-            )
-
-    return code_blocks
+    return [payload for kind, payload in _iter_message_segments(text) if kind == "code"]
 
 
 def create_interactive_message_widget(message_text: str) -> QWidget:
@@ -720,21 +818,16 @@ def create_interactive_message_widget(message_text: str) -> QWidget:
     widget = QWidget()
     layout = QVBoxLayout(widget)
 
-    # Extract and process code blocks
-    code_blocks = extract_code_blocks(message_text)
-
-    # Add text content (simplified markdown rendering)
-    text_parts = re.split(r"```\w*\n.*?\n```", message_text, flags=re.DOTALL)
-
-    for i, text_part in enumerate(text_parts):
-        if text_part.strip():
-            text_label = QLabel(text_part.strip())
-            text_label.setWordWrap(True)
-            layout.addWidget(text_label)
-
-        # Add interactive code block if available
-        if i < len(code_blocks) and code_blocks[i]["executable"]:
-            interactive_block = InteractiveCodeBlock(code_blocks[i]["code"])
+    # Single pass over the message: prose becomes labels (simplified
+    # markdown rendering), executable code becomes interactive blocks
+    for kind, payload in _iter_message_segments(message_text):
+        if kind == "text":
+            if payload.strip():
+                text_label = QLabel(payload.strip())
+                text_label.setWordWrap(True)
+                layout.addWidget(text_label)
+        elif payload["executable"]:
+            interactive_block = InteractiveCodeBlock(payload["code"])
             layout.addWidget(interactive_block)
 
     return widget
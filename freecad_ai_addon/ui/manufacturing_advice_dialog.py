@@ -4,7 +4,8 @@ Manufacturing Advice Dialog
 Shows material/process recommendations and cost estimates in a simple Qt dialog.
 """
 
-from typing import List
+import functools
+from typing import Any, Dict, Hashable
 
 # Prefer FreeCAD-bundled Qt bindings: PySide (Qt4) or PySide2 (Qt5). Avoid hard-dependence on PySide6.
 try:
@@ -15,7 +16,7 @@ try:
     QDialog = _QtGui.QDialog  # type: ignore
     QVBoxLayout = _QtGui.QVBoxLayout  # type: ignore
     QLabel = _QtGui.QLabel  # type: ignore
-    QTextEdit = _QtGui.QTextEdit  # type: ignore
+    QPlainTextEdit = _QtGui.QPlainTextEdit  # type: ignore
     QHBoxLayout = _QtGui.QHBoxLayout  # type: ignore
     QPushButton = _QtGui.QPushButton  # type: ignore
 except Exception:
@@ -25,7 +26,7 @@ except Exception:
             QDialog,
             QVBoxLayout,
             QLabel,
-            QTextEdit,
+            QPlainTextEdit,
             QHBoxLayout,
             QPushButton,
         )
@@ -36,7 +37,7 @@ except Exception:
             QDialog,
             QVBoxLayout,
             QLabel,
-            QTextEdit,
+            QPlainTextEdit,
             QHBoxLayout,
             QPushButton,
         )
@@ -46,6 +47,104 @@ from freecad_ai_addon.advanced_features import (
 )
 from freecad_ai_addon.advanced_features.manufacturing_advisor import advice_to_dict
 
+try:
+    import FreeCAD as App  # type: ignore
+except ImportError:  # Allow import outside FreeCAD
+    App = None
+
+
+# Global advisor instance shared by all dialogs
+_advisor = None
+
+
+def _get_advisor() -> ManufacturingAdvisor:
+    """Get the shared manufacturing advisor instance"""
+    global _advisor
+    if _advisor is None:
+        _advisor = ManufacturingAdvisor()
+    return _advisor
+
+
+def _geometry_stamp(object_name: str) -> Hashable:
+    """Identify the active document and the object's current geometry.
+
+    Shape.hashCode() changes whenever a recompute or placement change
+    produces a new shape, so advice can be cached against it without
+    observing every document change.
+    """
+    if App is None:
+        return None
+    doc = App.activeDocument()
+    if doc is None:
+        return None
+    shape = getattr(doc.getObject(object_name), "Shape", None)
+    try:
+        shape_hash = shape.hashCode() if shape is not None else None
+    except Exception:
+        shape_hash = None
+    return (doc.Name, shape_hash)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_advice(object_name: str, quantity: int, stamp: Hashable) -> Dict[str, Any]:
+    """Analyze an object once per (name, quantity, geometry) and reuse the result.
+
+    ``stamp`` is only part of the cache key (see _geometry_stamp). The
+    returned dict is shared between callers and must not be mutated.
+    """
+    advice = _get_advisor().analyze_manufacturability(object_name, quantity=quantity)
+    return advice_to_dict(advice)
+
+
+def get_advice(object_name: str, quantity: int) -> Dict[str, Any]:
+    """Return advice for an object, reusing it while its geometry is unchanged"""
+    return _cached_advice(object_name, quantity, _geometry_stamp(object_name))
+
+
+def clear_advice_cache() -> None:
+    """Forget all cached advice"""
+    _cached_advice.cache_clear()
+
+
+def _bullets(items) -> str:
+    """Render items as an indented bullet list"""
+    return "\n".join(f"  • {item}" for item in items)
+
+
+def _format_advice(data: Dict[str, Any]) -> str:
+    """Render an advice dict as plain text, skipping empty sections"""
+    materials = _bullets(
+        f"{m['name']} (Yield {m['yield_strength']} MPa, ${m['cost_per_kg']}/kg)"
+        for m in data.get("recommended_materials", [])[:3]
+    )
+    processes = _bullets(
+        f"{p['process'].replace('_', ' ').title()} — score "
+        f"{p['suitability_score']:.1f}, lead {p['lead_time_days']}d"
+        for p in data.get("recommended_processes", [])[:3]
+    )
+    sections = [
+        f"Recommended Materials:\n{materials}".rstrip("\n"),
+        f"Recommended Processes:\n{processes}".rstrip("\n"),
+    ]
+
+    costs = data.get("cost_estimates", [])
+    if costs:
+        c0 = costs[0]
+        sections.append(
+            f"Cost Estimate: ${c0['total_cost']:.2f} total "
+            f"(${c0['cost_per_unit']:.2f}/unit)"
+        )
+    if data.get("dfm_recommendations"):
+        sections.append(
+            f"DFM Recommendations:\n{_bullets(data['dfm_recommendations'][:5])}"
+        )
+    if data.get("risk_factors"):
+        sections.append(f"Risk Factors:\n{_bullets(data['risk_factors'][:5])}")
+    if data.get("timeline_estimate"):
+        sections.append(f"Timeline: {data['timeline_estimate']}")
+
+    return "\n\n".join(sections)
+
 
 class ManufacturingAdviceDialog(QDialog):
     """Simple dialog to show manufacturing advice for a given object."""
@@ -61,7 +160,7 @@ class ManufacturingAdviceDialog(QDialog):
         header.setTextFormat(Qt.RichText)
         layout.addWidget(header)
 
-        self.text = QTextEdit()
+        self.text = QPlainTextEdit()
         self.text.setReadOnly(True)
         layout.addWidget(self.text, 1)
 
@@ -75,46 +174,5 @@ class ManufacturingAdviceDialog(QDialog):
         self._load_advice(object_name, quantity)
 
     def _load_advice(self, object_name: str, quantity: int):
-        advisor = ManufacturingAdvisor()
-        advice = advisor.analyze_manufacturability(object_name, quantity=quantity)
-        data = advice_to_dict(advice)
-
-        lines: List[str] = []
-        lines.append("Recommended Materials:")
-        for m in data.get("recommended_materials", [])[:3]:
-            lines.append(
-                f"  • {m['name']} (Yield {m['yield_strength']} MPa, ${m['cost_per_kg']}/kg)"
-            )
-
-        lines.append("")
-        lines.append("Recommended Processes:")
-        for p in data.get("recommended_processes", [])[:3]:
-            lines.append(
-                f"  • {p['process'].replace('_', ' ').title()} — score {p['suitability_score']:.1f}, lead {p['lead_time_days']}d"
-            )
-
-        lines.append("")
-        costs = data.get("cost_estimates", [])
-        if costs:
-            c0 = costs[0]
-            lines.append(
-                f"Cost Estimate: ${c0['total_cost']:.2f} total (${c0['cost_per_unit']:.2f}/unit)"
-            )
-
-        lines.append("")
-        if data.get("dfm_recommendations"):
-            lines.append("DFM Recommendations:")
-            for r in data["dfm_recommendations"][:5]:
-                lines.append(f"  • {r}")
-
-        if data.get("risk_factors"):
-            lines.append("")
-            lines.append("Risk Factors:")
-            for r in data["risk_factors"][:5]:
-                lines.append(f"  • {r}")
-
-        if data.get("timeline_estimate"):
-            lines.append("")
-            lines.append(f"Timeline: {data['timeline_estimate']}")
-
-        self.text.setPlainText("\n".join(lines))
+        data = get_advice(object_name, quantity)
+        self.text.setPlainText(_format_advice(data))
@@ -6,6 +6,8 @@ connection testing, and usage statistics.
 """
 
 import asyncio
+import concurrent.futures
+from collections import Counter
 from typing import Optional, Dict
 
 try:
@@ -19,6 +21,7 @@ except Exception:
 from freecad_ai_addon.ui.security_dialogs import APIKeyInputDialog
 from freecad_ai_addon.core.provider_status import (
     get_provider_monitor,
+    run_in_monitor_loop,
     ProviderStatus,
     ProviderHealth,
 )
@@ -27,16 +30,52 @@ from freecad_ai_addon.utils.logging import get_logger
 
 logger = get_logger("provider_ui")
 
+# Status indicator colors
+_STATUS_COLORS = {
+    ProviderStatus.CONNECTED: "#4CAF50",  # Green
+    ProviderStatus.CONNECTING: "#FF9800",  # Orange
+    ProviderStatus.DISCONNECTED: "#9E9E9E",  # Gray
+    ProviderStatus.ERROR: "#F44336",  # Red
+    ProviderStatus.RATE_LIMITED: "#FF5722",  # Deep Orange
+    ProviderStatus.EXPIRED: "#E91E63",  # Pink
+    ProviderStatus.UNKNOWN: "#607D8B",  # Blue Gray
+}
+
+# Prebuilt indicator stylesheets per color
+_INDICATOR_STYLESHEETS = {
+    color: f"color: {color}; font-size: 16px;" for color in _STATUS_COLORS.values()
+}
+
+# Human readable status names, e.g. "Rate Limited"
+_STATUS_TEXT = {
+    status: status.value.replace("_", " ").title() for status in ProviderStatus
+}
+
 
 class ProviderStatusWidget(QtWidgets.QWidget):
     """Widget showing real-time provider status"""
 
+    # Emitted after the widget has redrawn a new status
+    status_changed = QtCore.Signal()
+    # Emitted with the provider name when the user clicks "Edit"
+    edit_requested = QtCore.Signal(str)
+
     def __init__(self, provider: str, parent=None):
         """Initialize provider status widget"""
         super().__init__(parent)
         self.provider = provider
         self.monitor = get_provider_monitor()
         self.current_health: Optional[ProviderHealth] = None
+        self._last_color: Optional[str] = None
+        self._cleaned = False
+        self._test_future: Optional[concurrent.futures.Future] = None
+
+        # Collapse bursts of status callbacks into a single redraw
+        self._update_pending = False
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self._update_status)
 
         self._setup_ui()
         self._register_callbacks()
@@ -87,34 +126,32 @@ class ProviderStatusWidget(QtWidgets.QWidget):
     def _on_status_update(self, health: ProviderHealth):
         """Handle status updates from monitor"""
         self.current_health = health
-        QtCore.QMetaObject.invokeMethod(
-            self, "_update_status", QtCore.Qt.QueuedConnection
-        )
+        # Callbacks arrive on the monitor loop thread. Only the first one of
+        # a burst is marshaled to the GUI thread to start the timer; later
+        # ones just replace the health the pending redraw will show.
+        if not self._update_pending:
+            self._update_pending = True
+            QtCore.QMetaObject.invokeMethod(
+                self._debounce, "start", QtCore.Qt.QueuedConnection
+            )
 
     @QtCore.Slot()
     def _update_status(self):
         """Update UI based on current health status"""
+        self._update_pending = False
         if not self.current_health:
             health = self.monitor.get_provider_status(self.provider)
         else:
             health = self.current_health
 
         # Update status indicator color
-        status_colors = {
-            ProviderStatus.CONNECTED: "#4CAF50",  # Green
-            ProviderStatus.CONNECTING: "#FF9800",  # Orange
-            ProviderStatus.DISCONNECTED: "#9E9E9E",  # Gray
-            ProviderStatus.ERROR: "#F44336",  # Red
-            ProviderStatus.RATE_LIMITED: "#FF5722",  # Deep Orange
-            ProviderStatus.EXPIRED: "#E91E63",  # Pink
-            ProviderStatus.UNKNOWN: "#607D8B",  # Blue Gray
-        }
-
-        color = status_colors.get(health.status, "#607D8B")
-        self.status_indicator.setStyleSheet(f"color: {color}; font-size: 16px;")
+        color = _STATUS_COLORS.get(health.status, "#607D8B")
+        if color != self._last_color:
+            self.status_indicator.setStyleSheet(_INDICATOR_STYLESHEETS[color])
+            self._last_color = color
 
         # Update status text
-        status_text = health.status.value.replace("_", " ").title()
+        status_text = _STATUS_TEXT[health.status]
         self.status_label.setText(status_text)
 
         # Update response time
@@ -127,18 +164,18 @@ class ProviderStatusWidget(QtWidgets.QWidget):
             self.response_label.setText("")
 
         # Update tooltip with detailed info
-        tooltip_parts = [f"Status: {status_text}"]
-        if health.error_message:
-            tooltip_parts.append(f"Error: {health.error_message}")
-        if health.response_time is not None:
-            tooltip_parts.append(f"Response time: {health.response_time:.2f}ms")
-        if health.rate_limit_remaining is not None:
-            tooltip_parts.append(f"Rate limit remaining: {health.rate_limit_remaining}")
-        if health.usage_stats:
-            for key, value in health.usage_stats.items():
-                tooltip_parts.append(f"{key.replace('_', ' ').title()}: {value}")
-
-        self.setToolTip("\n".join(tooltip_parts))
+        tooltip_parts = [
+            f"Status: {status_text}",
+            health.error_message and f"Error: {health.error_message}",
+            health.response_time is not None
+            and f"Response time: {health.response_time:.2f}ms",
+            health.rate_limit_remaining is not None
+            and f"Rate limit remaining: {health.rate_limit_remaining}",
+            *health.formatted_usage_stats(),
+        ]
+        self.setToolTip("\n".join(part for part in tooltip_parts if part))
+
+        self.status_changed.emit()
 
     @QtCore.Slot()
     def _test_connection(self):
@@ -154,8 +191,8 @@ class ProviderStatusWidget(QtWidgets.QWidget):
                     self, "_test_complete", QtCore.Qt.QueuedConnection
                 )
 
-        # Run in event loop
-        asyncio.create_task(test_async())
+        # Run on the shared monitor event loop
+        self._test_future = run_in_monitor_loop(test_async())
 
     @QtCore.Slot()
     def _test_complete(self):
@@ -165,34 +202,50 @@ class ProviderStatusWidget(QtWidgets.QWidget):
 
     @QtCore.Slot()
     def _edit_provider(self):
-        """Open edit dialog for this provider"""
-        dialog = APIKeyInputDialog(self.provider, self)
-        if dialog.exec() == QtWidgets.QDialog.Accepted:
-            # Trigger a status check after editing
-            asyncio.create_task(self.monitor.check_provider_connection(self.provider))
+        """Ask the owning dialog to edit this provider"""
+        self.edit_requested.emit(self.provider)
 
     def cleanup(self):
         """Clean up resources"""
+        if self._cleaned:
+            return
+        self._cleaned = True
+        if self._test_future and not self._test_future.done():
+            self._test_future.cancel()
         self.monitor.unregister_status_callback(self.provider, self._on_status_update)
 
 
 class EnhancedProviderManagerDialog(QtWidgets.QDialog):
     """Enhanced provider management dialog with real-time monitoring"""
 
+    # Upper bound on simultaneous connection checks during "Refresh All"
+    MAX_PARALLEL_CHECKS = 4
+
     def __init__(self, parent=None):
         """Initialize the enhanced provider manager dialog"""
         super().__init__(parent)
         self.credential_manager = get_credential_manager()
         self.monitor = get_provider_monitor()
         self.provider_widgets: Dict[str, ProviderStatusWidget] = {}
+        self._key_dialog: Optional[APIKeyInputDialog] = None
 
         self.setWindowTitle("AI Provider Management")
         self.setModal(True)
         self.setMinimumSize(800, 600)
 
+        self._poll_interval = 30.0
+        self._refresh_future: Optional[concurrent.futures.Future] = None
+
+        # Rebuild the summary once per burst of provider status changes
+        self._status_text_debounce = QtCore.QTimer(self)
+        self._status_text_debounce.setSingleShot(True)
+        self._status_text_debounce.setInterval(50)
+        self._status_text_debounce.timeout.connect(self._update_status_text)
+
         self._setup_ui()
         self._refresh_providers()
-        self._start_monitoring()
+        if self.auto_refresh_checkbox.isChecked():
+            self._start_monitoring()
 
     def _setup_ui(self):
         """Set up the user interface"""
@@ -262,9 +315,12 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
         status_group = QtWidgets.QGroupBox("System Status")
         status_layout = QtWidgets.QVBoxLayout(status_group)
 
-        self.status_text = QtWidgets.QTextEdit()
+        self.status_text = QtWidgets.QLabel()
+        self.status_text.setTextFormat(QtCore.Qt.PlainText)
+        self.status_text.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
+        self.status_text.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.status_text.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
         self.status_text.setMaximumHeight(100)
-        self.status_text.setReadOnly(True)
         status_layout.addWidget(self.status_text)
 
         layout.addWidget(status_group)
@@ -290,20 +346,28 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
 
     def _refresh_providers(self):
         """Refresh the provider list"""
-        # Clear existing widgets
-        for widget in self.provider_widgets.values():
-            widget.cleanup()
-            widget.setParent(None)
-        self.provider_widgets.clear()
-
-        # Add provider widgets
-        providers = self.credential_manager.list_providers()
-        for provider in providers:
-            widget = ProviderStatusWidget(provider, self)
-            self.provider_widgets[provider] = widget
-            self.providers_layout.insertWidget(
-                self.providers_layout.count() - 1, widget
-            )
+        # Rebuild the list without repainting after every change
+        self.providers_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing widgets
+            for widget in self.provider_widgets.values():
+                widget.cleanup()
+                widget.setParent(None)
+            self.provider_widgets.clear()
+
+            # Drop the trailing stretch, append the widgets, then restore it
+            self.providers_layout.takeAt(self.providers_layout.count() - 1)
+            providers = self.credential_manager.list_providers()
+            for provider in providers:
+                widget = ProviderStatusWidget(provider, self)
+                widget.status_changed.connect(self._status_text_debounce.start)
+                widget.edit_requested.connect(self._edit_provider)
+                self.provider_widgets[provider] = widget
+                self.providers_layout.addWidget(widget)
+            self.providers_layout.addStretch()
+        finally:
+            self.providers_widget.setUpdatesEnabled(True)
+        self.providers_widget.updateGeometry()
 
         self._update_status_text()
 
@@ -316,15 +380,18 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
         else:
             status_lines.append(f"Total providers: {len(self.provider_widgets)}")
 
-            # Count by status
-            status_counts = {}
-            for widget in self.provider_widgets.values():
-                health = self.monitor.get_provider_status(widget.provider)
-                status = health.status.value
-                status_counts[status] = status_counts.get(status, 0) + 1
+            # Count by status, preferring the health each widget already holds
+            status_counts = Counter(
+                (
+                    widget.current_health
+                    or self.monitor.get_provider_status(widget.provider)
+                ).status
+                for widget in self.provider_widgets.values()
+            )
 
-            for status, count in status_counts.items():
-                status_lines.append(f"  {status.replace('_', ' ').title()}: {count}")
+            # Most frequent status first
+            for status, count in status_counts.most_common():
+                status_lines.append(f"  {_STATUS_TEXT[status]}: {count}")
 
         # Monitoring status
         status_lines.append("")
@@ -335,13 +402,29 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
 
         self.status_text.setText("\n".join(status_lines))
 
+    def _get_key_dialog(self, provider: str) -> APIKeyInputDialog:
+        """Return the shared API key dialog, set up for a provider"""
+        if self._key_dialog is None:
+            self._key_dialog = APIKeyInputDialog(provider, self)
+        else:
+            self._key_dialog.reset_for_provider(provider)
+        return self._key_dialog
+
+    @QtCore.Slot(str)
+    def _edit_provider(self, provider: str):
+        """Open edit dialog for a provider"""
+        dialog = self._get_key_dialog(provider)
+        if dialog.exec() == QtWidgets.QDialog.Accepted:
+            # Trigger a status check after editing
+            run_in_monitor_loop(self.monitor.check_provider_connection(provider))
+
     def _add_provider(self, provider: str):
         """Add a new provider"""
-        dialog = APIKeyInputDialog(provider, self)
+        dialog = self._get_key_dialog(provider)
         if dialog.exec() == QtWidgets.QDialog.Accepted:
             self._refresh_providers()
             # Test the new provider
-            asyncio.create_task(self.monitor.check_provider_connection(provider))
+            run_in_monitor_loop(self.monitor.check_provider_connection(provider))
 
     @QtCore.Slot()
     def _refresh_all_providers(self):
@@ -350,12 +433,18 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
         self.refresh_button.setText("Refreshing...")
 
         async def refresh_async():
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_CHECKS)
+
+            async def bounded_check(provider: str):
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        self.monitor.check_provider_connection(provider),
+                        timeout=self._poll_interval,
+                    )
+
             try:
                 providers = list(self.provider_widgets.keys())
-                tasks = [
-                    self.monitor.check_provider_connection(provider)
-                    for provider in providers
-                ]
+                tasks = [bounded_check(provider) for provider in providers]
                 if tasks:
                     await asyncio.gather(*tasks, return_exceptions=True)
             finally:
@@ -363,7 +452,7 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
                     self, "_refresh_complete", QtCore.Qt.QueuedConnection
                 )
 
-        asyncio.create_task(refresh_async())
+        self._refresh_future = run_in_monitor_loop(refresh_async())
 
     @QtCore.Slot()
     def _refresh_complete(self):
@@ -382,12 +471,14 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
 
     def _start_monitoring(self):
         """Start provider monitoring"""
-        asyncio.create_task(self.monitor.start_monitoring(interval=30.0))
+        run_in_monitor_loop(
+            self.monitor.start_monitoring(interval=self._poll_interval, adaptive=True)
+        )
         logger.info("Started provider monitoring")
 
     def _stop_monitoring(self):
         """Stop provider monitoring"""
-        asyncio.create_task(self.monitor.stop_monitoring())
+        run_in_monitor_loop(self.monitor.stop_monitoring())
         logger.info("Stopped provider monitoring")
 
     @QtCore.Slot()
@@ -463,11 +554,15 @@ class EnhancedProviderManagerDialog(QtWidgets.QDialog):
 
     def closeEvent(self, event):
         """Handle dialog close event"""
+        # Cancel an in-flight refresh so it no longer touches this dialog
+        if self._refresh_future and not self._refresh_future.done():
+            self._refresh_future.cancel()
+
         # Clean up provider widgets
         for widget in self.provider_widgets.values():
             widget.cleanup()
 
         # Stop monitoring if it was started
-        asyncio.create_task(self.monitor.stop_monitoring())
+        run_in_monitor_loop(self.monitor.stop_monitoring())
 
         super().closeEvent(event)
@@ -5,28 +5,175 @@ Provides user interface components for securely managing API keys
 and provider credentials.
 """
 
-from typing import Dict
+import functools
+import threading
+from typing import Dict, Optional, Set
 from PySide6 import QtWidgets, QtCore
 from freecad_ai_addon.utils.security import get_credential_manager
+from freecad_ai_addon.utils import credential_cache
 from freecad_ai_addon.utils.logging import get_logger
 
 logger = get_logger("security_ui")
 
+# Static stylesheets, shared so Qt parses each string once
+_HEADER_QSS = "font-size: 14px; font-weight: bold; margin-bottom: 10px;"
+_MANAGER_HEADER_QSS = "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
+_DESC_QSS = "color: #666; margin-bottom: 15px;"
+_DANGER_QSS = "color: #d32f2f;"
+_SUCCESS_QSS = "color: #388e3c;"
+
+_DEFAULT_OLLAMA_URL = "http://localhost:11434"
+
+_PROVIDER_DESCRIPTIONS = {
+    "openai": (
+        "Enter your OpenAI API key to access GPT models. "
+        "You can find your API key at https://platform.openai.com/api-keys"
+    ),
+    "anthropic": (
+        "Enter your Anthropic API key to access Claude models. "
+        "You can find your API key at https://console.anthropic.com/"
+    ),
+    "ollama": (
+        "Configure connection to your local Ollama instance. "
+        "Make sure Ollama is running on your system."
+    ),
+}
+_DEFAULT_DESCRIPTION = "Enter credentials for this AI provider."
+
+# Extra form rows per provider: (credential type, label, placeholder, default).
+# Each row's QLineEdit is stored in the dialog's ``_extra_inputs`` by type.
+_PROVIDER_FIELDS = {
+    "openai": (("org_id", "Organization ID:", "Optional: Organization ID", ""),),
+    "ollama": (("base_url", "Base URL:", _DEFAULT_OLLAMA_URL, _DEFAULT_OLLAMA_URL),),
+}
+
+
+class _CredentialTaskSignals(QtCore.QObject):
+    """Signal holder for CredentialLoadTask (QRunnable is not a QObject)"""
+
+    loaded = QtCore.Signal(dict)
+
+
+class CredentialLoadTask(QtCore.QRunnable):
+    """Run a blocking credential lookup on the global thread pool
+
+    The result dict is delivered through ``signals.loaded``, which Qt queues
+    back to the thread the receiver lives in (the GUI thread).
+    """
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self._func = func
+        self._args = args
+        self.signals = _CredentialTaskSignals()
+
+    def run(self):
+        try:
+            result = self._func(*self._args)
+        except Exception as e:
+            logger.error("Failed to load credentials: %s", e)
+            result = {"error": str(e)}
+        self.signals.loaded.emit(result)
+
+
+def _basic_connection_check(provider: str, credentials: Dict[str, str]) -> str:
+    """Basic format validation when full testing is not available
+
+    Returns an error message, or an empty string if the credentials look usable.
+    """
+    if provider == "openai":
+        if not credentials.get("api_key", "").startswith("sk-"):
+            return "Invalid OpenAI API key format"
+    elif provider == "anthropic":
+        if not credentials.get("api_key", "").startswith("sk-ant-"):
+            return "Invalid Anthropic API key format"
+    elif provider == "ollama":
+        # For Ollama, just check if base_url is provided
+        if not credentials.get("base_url"):
+            return "Base URL is required for Ollama"
+    elif not credentials.get("api_key"):
+        return "API key is required"
+    return ""
+
+
+class _ConnectionTestSignals(QtCore.QObject):
+    """Signal holder for ConnectionTestTask"""
+
+    success = QtCore.Signal()
+    failure = QtCore.Signal(str)
+
+
+class ConnectionTestTask(QtCore.QRunnable):
+    """Test provider credentials on the global thread pool
+
+    Setting ``cancel_event`` suppresses the result; the probe itself cannot be
+    interrupted, but a cancelled test never touches the (possibly closed)
+    dialog.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        credentials: Dict[str, str],
+        cancel_event: threading.Event,
+    ):
+        super().__init__()
+        self.provider = provider
+        self.credentials = credentials
+        self.cancel_event = cancel_event
+        self.signals = _ConnectionTestSignals()
+
+    def run(self):
+        if self.cancel_event.is_set():
+            return
+        try:
+            try:
+                from freecad_ai_addon.core.provider_status import (
+                    test_provider_connection,
+                )
+            except ImportError:
+                # Fallback to basic validation if full testing is not available
+                error = _basic_connection_check(self.provider, self.credentials)
+            else:
+                ok = test_provider_connection(self.provider, self.credentials)
+                error = "" if ok else "Connection test failed"
+        except Exception as e:
+            error = f"Connection error: {e}"
+
+        if self.cancel_event.is_set():
+            return
+        if error:
+            self.signals.failure.emit(error)
+        else:
+            self.signals.success.emit()
+
 
 class APIKeyInputDialog(QtWidgets.QDialog):
     """Dialog for securely inputting API keys"""
 
-    def __init__(self, provider: str, parent=None):
+    def __init__(
+        self,
+        provider: str,
+        parent=None,
+        known_providers: Optional[Set[str]] = None,
+    ):
         """
         Initialize the API key input dialog
 
         Args:
             provider: Name of the AI provider (e.g., 'openai', 'anthropic')
             parent: Parent widget
+            known_providers: Providers with stored credentials, if already
+                known; loading is skipped for providers not in the set
         """
         super().__init__(parent)
         self.provider = provider
+        self.known_providers = known_providers
         self.credential_manager = get_credential_manager()
+        self._load_task = None
+        self._test_task = None
+        self._test_cancel = threading.Event()
+        self._extra_inputs: Dict[str, QtWidgets.QLineEdit] = {}
 
         self.setWindowTitle(f"{provider.title()} API Configuration")
         self.setModal(True)
@@ -40,21 +187,22 @@ class APIKeyInputDialog(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout(self)
 
         # Header
-        header_label = QtWidgets.QLabel(f"Configure {self.provider.title()} API Access")
-        header_label.setStyleSheet(
-            "font-size: 14px; font-weight: bold; margin-bottom: 10px;"
+        self.header_label = QtWidgets.QLabel(
+            f"Configure {self.provider.title()} API Access"
         )
-        layout.addWidget(header_label)
+        self.header_label.setStyleSheet(_HEADER_QSS)
+        layout.addWidget(self.header_label)
 
         # Description
         desc_text = self._get_provider_description()
-        desc_label = QtWidgets.QLabel(desc_text)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 15px;")
-        layout.addWidget(desc_label)
+        self.desc_label = QtWidgets.QLabel(desc_text)
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setStyleSheet(_DESC_QSS)
+        layout.addWidget(self.desc_label)
 
         # Form layout
         form_layout = QtWidgets.QFormLayout()
+        self.form_layout = form_layout
 
         # API Key input
         self.api_key_input = QtWidgets.QLineEdit()
@@ -97,7 +245,7 @@ class APIKeyInputDialog(QtWidgets.QDialog):
 
         self.remove_button = QtWidgets.QPushButton("Remove Credentials")
         self.remove_button.clicked.connect(self._remove_credentials)
-        self.remove_button.setStyleSheet("color: #d32f2f;")
+        self.remove_button.setStyleSheet(_DANGER_QSS)
 
         button_layout.addWidget(self.remove_button)
         button_layout.addStretch()
@@ -108,67 +256,111 @@ class APIKeyInputDialog(QtWidgets.QDialog):
 
     def _get_provider_description(self) -> str:
         """Get description text for the provider"""
-        descriptions = {
-            "openai": (
-                "Enter your OpenAI API key to access GPT models. "
-                "You can find your API key at https://platform.openai.com/api-keys"
-            ),
-            "anthropic": (
-                "Enter your Anthropic API key to access Claude models. "
-                "You can find your API key at https://console.anthropic.com/"
-            ),
-            "ollama": (
-                "Configure connection to your local Ollama instance. "
-                "Make sure Ollama is running on your system."
-            ),
-        }
-        return descriptions.get(
-            self.provider, "Enter credentials for this AI provider."
-        )
+        return _PROVIDER_DESCRIPTIONS.get(self.provider, _DEFAULT_DESCRIPTION)
 
     def _add_provider_specific_fields(self, form_layout: QtWidgets.QFormLayout):
         """Add provider-specific input fields"""
-        if self.provider == "openai":
-            # Organization ID (optional)
-            self.org_id_input = QtWidgets.QLineEdit()
-            self.org_id_input.setPlaceholderText("Optional: Organization ID")
-            form_layout.addRow("Organization ID:", self.org_id_input)
-
-        elif self.provider == "anthropic":
-            # No additional fields for Anthropic currently
-            pass
-
-        elif self.provider == "ollama":
-            # Base URL for Ollama
-            self.base_url_input = QtWidgets.QLineEdit()
-            self.base_url_input.setPlaceholderText("http://localhost:11434")
-            self.base_url_input.setText("http://localhost:11434")
-            form_layout.addRow("Base URL:", self.base_url_input)
+        for cred_type, label, placeholder, default in _PROVIDER_FIELDS.get(
+            self.provider, ()
+        ):
+            widget = QtWidgets.QLineEdit()
+            widget.setPlaceholderText(placeholder)
+            if default:
+                widget.setText(default)
+            form_layout.addRow(label, widget)
+            self._extra_inputs[cred_type] = widget
+
+    def _reset_extra_inputs(self):
+        """Put the provider-specific fields back to their defaults"""
+        for cred_type, _label, _placeholder, default in _PROVIDER_FIELDS.get(
+            self.provider, ()
+        ):
+            self._extra_inputs[cred_type].setText(default)
 
     def _load_existing_credentials(self):
-        """Load existing credentials into the form"""
-        try:
-            # Load API key
-            api_key = self.credential_manager.get_credential(self.provider, "api_key")
-            if api_key:
-                self.api_key_input.setText(api_key)
-
-            # Load provider-specific credentials
-            if self.provider == "openai":
-                org_id = self.credential_manager.get_credential(self.provider, "org_id")
-                if org_id and hasattr(self, "org_id_input"):
-                    self.org_id_input.setText(org_id)
-
-            elif self.provider == "ollama":
-                base_url = self.credential_manager.get_credential(
-                    self.provider, "base_url"
-                )
-                if base_url and hasattr(self, "base_url_input"):
-                    self.base_url_input.setText(base_url)
+        """Load existing credentials into the form without blocking the GUI"""
+        if self.known_providers is not None and (
+            self.provider not in self.known_providers
+        ):
+            # Nothing stored for this provider, so there is nothing to load
+            return
 
-        except Exception as e:
-            logger.error("Failed to load existing credentials: %s", str(e))
+        self.api_key_input.setPlaceholderText("Loading…")
+        task = CredentialLoadTask(self._read_credentials, self.provider)
+        task.signals.loaded.connect(self._apply_loaded_credentials)
+        # Keep the signal holder alive until the worker has emitted
+        self._load_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _read_credentials(self, provider: str) -> Dict[str, object]:
+        """Read the stored credentials for a provider (runs in a worker thread)"""
+        cred_types = ["api_key"]
+        cred_types.extend(field[0] for field in _PROVIDER_FIELDS.get(provider, ()))
+
+        # Values come straight from the manager (which caches decrypted data
+        # itself), so no plaintext secrets are kept in credential_cache
+        manager = get_credential_manager()
+        credentials = {}
+        for cred_type in cred_types:
+            value = manager.get_credential(provider, cred_type)
+            if value:
+                credentials[cred_type] = value
+        return {"provider": provider, "credentials": credentials}
+
+    @QtCore.Slot(dict)
+    def _apply_loaded_credentials(self, result: dict):
+        """Populate the form with credentials loaded by CredentialLoadTask"""
+        self.api_key_input.setPlaceholderText("Enter your API key...")
+        if "error" in result:
+            logger.error("Failed to load existing credentials: %s", result["error"])
+            return
+        if result.get("provider") != self.provider:
+            # Stale result from before the dialog was reused
+            return
 
+        credentials = result["credentials"]
+        # Never overwrite anything the user typed while the load was running
+        api_key = credentials.get("api_key")
+        if api_key and not self.api_key_input.text():
+            self.api_key_input.setText(api_key)
+
+        for cred_type, widget in self._extra_inputs.items():
+            value = credentials.get(cred_type)
+            if value and not widget.isModified():
+                widget.setText(value)
+
+    def reset_fields(self):
+        """Reset the form to the stored credentials so the dialog can be reused"""
+        self._cancel_connection_test()
+        self.api_key_input.clear()
+        self.show_key_checkbox.setChecked(False)
+        self._reset_extra_inputs()
+        self.status_label.clear()
+        self.status_label.setStyleSheet("")
+
+        self._load_existing_credentials()
+        self.api_key_input.setFocus()
+
+    def reset_for_provider(
+        self, provider: str, known_providers: Optional[Set[str]] = None
+    ):
+        """Reuse the dialog for another provider instead of building a new one"""
+        self.known_providers = known_providers
+        if provider != self.provider:
+            # Drop the previous provider's extra rows before adding the new ones
+            for widget in self._extra_inputs.values():
+                self.form_layout.removeRow(widget)
+            self._extra_inputs.clear()
+
+            self.provider = provider
+            self.setWindowTitle(f"{provider.title()} API Configuration")
+            self.header_label.setText(f"Configure {provider.title()} API Access")
+            self.desc_label.setText(self._get_provider_description())
+            self._add_provider_specific_fields(self.form_layout)
+
+        self.reset_fields()
+
+    @QtCore.Slot(bool)
     def _toggle_api_key_visibility(self, checked: bool):
         """Toggle API key visibility"""
         if checked:
@@ -176,86 +368,57 @@ class APIKeyInputDialog(QtWidgets.QDialog):
         else:
             self.api_key_input.setEchoMode(QtWidgets.QLineEdit.Password)
 
+    @QtCore.Slot()
     def _test_connection(self):
-        """Test the connection with provided credentials"""
+        """Test the connection with provided credentials in the background"""
+        # Get current values from form
+        credentials = self._get_form_credentials()
+        if not credentials.get("api_key") and self.provider != "ollama":
+            self._show_status("API key is required", error=True)
+            return
+
+        self._cancel_connection_test()
+        self._test_cancel = threading.Event()
+
         self.test_button.setEnabled(False)
         self.test_button.setText("Testing...")
         self.status_label.setText("Testing connection...")
 
-        try:
-            # Get current values from form
-            credentials = self._get_form_credentials()
-
-            # Perform actual connection testing
-            if not credentials.get("api_key") and self.provider != "ollama":
-                self._show_status("API key is required", error=True)
-                return
-
-            # Test the connection using the provider manager
-            self._test_provider_connection(credentials)
-
-        except Exception as e:
-            self._show_status(f"Connection test failed: {str(e)}", error=True)
-        finally:
-            self.test_button.setEnabled(True)
-            self.test_button.setText("Test Connection")
-
-    def _test_provider_connection(self, credentials: Dict[str, str]):
-        """Test the actual provider connection"""
-        try:
-            from freecad_ai_addon.core.provider_status import test_provider_connection
-
-            # Use the provider status module to test the connection
-            success = test_provider_connection(self.provider, credentials)
-
-            if success:
-                self._connection_test_success()
-            else:
-                self._show_status("Connection test failed", error=True)
-
-        except ImportError:
-            # Fallback to basic validation if provider_status not available
-            self._basic_connection_validation(credentials)
-        except Exception as e:
-            self._show_status(f"Connection error: {str(e)}", error=True)
-
-    def _basic_connection_validation(self, credentials: Dict[str, str]):
-        """Basic validation when full testing is not available"""
-        # Basic validation checks
-        if self.provider == "openai":
-            if credentials.get("api_key", "").startswith("sk-"):
-                self._connection_test_success()
-            else:
-                self._show_status("Invalid OpenAI API key format", error=True)
-        elif self.provider == "anthropic":
-            if credentials.get("api_key", "").startswith("sk-ant-"):
-                self._connection_test_success()
-            else:
-                self._show_status("Invalid Anthropic API key format", error=True)
-        elif self.provider == "ollama":
-            # For Ollama, just check if base_url is provided
-            if credentials.get("base_url"):
-                self._connection_test_success()
-            else:
-                self._show_status("Base URL is required for Ollama", error=True)
-        else:
-            # Generic validation
-            if credentials.get("api_key"):
-                self._connection_test_success()
-            else:
-                self._show_status("API key is required", error=True)
-
+        task = ConnectionTestTask(self.provider, credentials, self._test_cancel)
+        task.signals.success.connect(self._connection_test_success)
+        task.signals.failure.connect(self._connection_test_failed)
+        self._test_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _cancel_connection_test(self):
+        """Discard the result of any connection test still running"""
+        self._test_cancel.set()
+        self._test_task = None
+        self.test_button.setEnabled(True)
+        self.test_button.setText("Test Connection")
+
+    def _finish_connection_test(self):
+        """Restore the test button once a test has reported back"""
+        self._test_task = None
+        self.test_button.setEnabled(True)
+        self.test_button.setText("Test Connection")
+
+    @QtCore.Slot(str)
+    def _connection_test_failed(self, message: str):
+        """Handle a failed connection test"""
+        self._finish_connection_test()
+        self._show_status(message, error=True)
+
+    @QtCore.Slot()
     def _connection_test_success(self):
         """Handle successful connection test"""
+        self._finish_connection_test()
         self._show_status("✓ Connection successful!", error=False)
 
     def _show_status(self, message: str, error: bool = False):
         """Show status message"""
         self.status_label.setText(message)
-        if error:
-            self.status_label.setStyleSheet("color: #d32f2f;")
-        else:
-            self.status_label.setStyleSheet("color: #388e3c;")
+        self.status_label.setStyleSheet(_DANGER_QSS if error else _SUCCESS_QSS)
 
     def _get_form_credentials(self) -> Dict[str, str]:
         """Get credentials from form inputs"""
@@ -267,18 +430,14 @@ class APIKeyInputDialog(QtWidgets.QDialog):
             credentials["api_key"] = api_key
 
         # Provider-specific fields
-        if self.provider == "openai" and hasattr(self, "org_id_input"):
-            org_id = self.org_id_input.text().strip()
-            if org_id:
-                credentials["org_id"] = org_id
-
-        elif self.provider == "ollama" and hasattr(self, "base_url_input"):
-            base_url = self.base_url_input.text().strip()
-            if base_url:
-                credentials["base_url"] = base_url
+        for cred_type, widget in self._extra_inputs.items():
+            value = widget.text().strip()
+            if value:
+                credentials[cred_type] = value
 
         return credentials
 
+    @QtCore.Slot()
     def _remove_credentials(self):
         """Remove stored credentials for this provider"""
         reply = QtWidgets.QMessageBox.question(
@@ -296,14 +455,16 @@ class APIKeyInputDialog(QtWidgets.QDialog):
 
                 # Clear form
                 self.api_key_input.clear()
-                if hasattr(self, "org_id_input"):
-                    self.org_id_input.clear()
-                if hasattr(self, "base_url_input"):
-                    self.base_url_input.setText("http://localhost:11434")
+                self._reset_extra_inputs()
 
             except Exception as e:
                 self._show_status(f"Failed to remove credentials: {str(e)}", error=True)
 
+    def reject(self):
+        """Cancel any running connection test and close the dialog"""
+        self._cancel_connection_test()
+        super().reject()
+
     def accept(self):
         """Save credentials and close dialog"""
         try:
@@ -314,15 +475,17 @@ class APIKeyInputDialog(QtWidgets.QDialog):
                 self._show_status("API key is required", error=True)
                 return
 
-            # Save credentials
-            for cred_type, value in credentials.items():
-                if not self.credential_manager.store_credential(
-                    self.provider, cred_type, value
-                ):
-                    self._show_status(f"Failed to save {cred_type}", error=True)
-                    return
+            # Save credentials with a single encrypt + write
+            with self.credential_manager.batch_update():
+                for cred_type, value in credentials.items():
+                    if not self.credential_manager.store_credential(
+                        self.provider, cred_type, value
+                    ):
+                        self._show_status(f"Failed to save {cred_type}", error=True)
+                        return
 
             logger.info("Successfully saved credentials for %s", self.provider)
+            self._cancel_connection_test()
             super().accept()
 
         except Exception as e:
@@ -336,23 +499,25 @@ class ProviderManagerDialog(QtWidgets.QDialog):
         """Initialize the provider manager dialog"""
         super().__init__(parent)
         self.credential_manager = get_credential_manager()
+        self._details_task = None
+        self._details_built = False
+        self._known_providers: Set[str] = set()
+        self._edit_dialog = None
 
         self.setWindowTitle("AI Provider Management")
         self.setModal(True)
         self.setMinimumSize(600, 400)
 
-        self._setup_ui()
+        self._setup_ui_core()
         self._refresh_provider_list()
 
-    def _setup_ui(self):
-        """Set up the user interface"""
+    def _setup_ui_core(self):
+        """Set up the provider list; the details pane is built on first use"""
         layout = QtWidgets.QVBoxLayout(self)
 
         # Header
         header_label = QtWidgets.QLabel("Manage AI Provider Credentials")
-        header_label.setStyleSheet(
-            "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
-        )
+        header_label.setStyleSheet(_MANAGER_HEADER_QSS)
         layout.addWidget(header_label)
 
         # Provider list
@@ -370,13 +535,19 @@ class ProviderManagerDialog(QtWidgets.QDialog):
         add_layout = QtWidgets.QHBoxLayout()
 
         self.add_openai_btn = QtWidgets.QPushButton("Add OpenAI")
-        self.add_openai_btn.clicked.connect(lambda: self._add_provider("openai"))
+        self.add_openai_btn.clicked.connect(
+            functools.partial(self._add_provider, "openai")
+        )
 
         self.add_anthropic_btn = QtWidgets.QPushButton("Add Anthropic")
-        self.add_anthropic_btn.clicked.connect(lambda: self._add_provider("anthropic"))
+        self.add_anthropic_btn.clicked.connect(
+            functools.partial(self._add_provider, "anthropic")
+        )
 
         self.add_ollama_btn = QtWidgets.QPushButton("Add Ollama")
-        self.add_ollama_btn.clicked.connect(lambda: self._add_provider("ollama"))
+        self.add_ollama_btn.clicked.connect(
+            functools.partial(self._add_provider, "ollama")
+        )
 
         add_layout.addWidget(self.add_openai_btn)
         add_layout.addWidget(self.add_anthropic_btn)
@@ -389,9 +560,36 @@ class ProviderManagerDialog(QtWidgets.QDialog):
         right_layout = QtWidgets.QVBoxLayout()
         right_layout.addWidget(QtWidgets.QLabel("Provider Details:"))
 
+        # Placeholder page keeps the layout stable until a provider is picked
+        self.details_stack = QtWidgets.QStackedWidget()
+        placeholder = QtWidgets.QLabel("Select a provider to see its details.")
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        self.details_stack.addWidget(placeholder)
+        right_layout.addWidget(self.details_stack)
+
+        list_layout.addLayout(right_layout)
+
+        layout.addLayout(list_layout)
+
+        # Close button
+        close_layout = QtWidgets.QHBoxLayout()
+        close_layout.addStretch()
+
+        self.close_btn = QtWidgets.QPushButton("Close")
+        self.close_btn.clicked.connect(self.accept)
+        close_layout.addWidget(self.close_btn)
+
+        layout.addLayout(close_layout)
+
+    def _setup_ui_details(self):
+        """Build the details text and provider action buttons"""
+        page = QtWidgets.QWidget()
+        page_layout = QtWidgets.QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+
         self.details_text = QtWidgets.QTextEdit()
         self.details_text.setReadOnly(True)
-        right_layout.addWidget(self.details_text)
+        page_layout.addWidget(self.details_text)
 
         # Provider action buttons
         action_layout = QtWidgets.QHBoxLayout()
@@ -407,47 +605,56 @@ class ProviderManagerDialog(QtWidgets.QDialog):
         self.remove_btn = QtWidgets.QPushButton("Remove")
         self.remove_btn.clicked.connect(self._remove_provider)
         self.remove_btn.setEnabled(False)
-        self.remove_btn.setStyleSheet("color: #d32f2f;")
+        self.remove_btn.setStyleSheet(_DANGER_QSS)
 
         action_layout.addWidget(self.edit_btn)
         action_layout.addWidget(self.test_btn)
         action_layout.addWidget(self.remove_btn)
         action_layout.addStretch()
 
-        right_layout.addLayout(action_layout)
-        list_layout.addLayout(right_layout)
-
-        layout.addLayout(list_layout)
-
-        # Close button
-        close_layout = QtWidgets.QHBoxLayout()
-        close_layout.addStretch()
-
-        self.close_btn = QtWidgets.QPushButton("Close")
-        self.close_btn.clicked.connect(self.accept)
-        close_layout.addWidget(self.close_btn)
+        page_layout.addLayout(action_layout)
 
-        layout.addLayout(close_layout)
+        self.details_stack.addWidget(page)
+        self.details_stack.setCurrentWidget(page)
+        self._details_built = True
 
     def _refresh_provider_list(self):
         """Refresh the list of configured providers"""
-        self.provider_list.clear()
+        providers = credential_cache.cached_list_providers()
+        self._known_providers = set(providers)
 
-        providers = self.credential_manager.list_providers()
-        for provider in providers:
-            item = QtWidgets.QListWidgetItem(provider.title())
-            item.setData(QtCore.Qt.UserRole, provider)
-            self.provider_list.addItem(item)
+        # Rebuild with one layout pass and no per-row signals
+        self.provider_list.setUpdatesEnabled(False)
+        self.provider_list.blockSignals(True)
+        try:
+            self.provider_list.clear()
+            for provider in providers:
+                item = QtWidgets.QListWidgetItem(provider.title())
+                item.setData(QtCore.Qt.UserRole, provider)
+                self.provider_list.addItem(item)
+        finally:
+            self.provider_list.blockSignals(False)
+            self.provider_list.setUpdatesEnabled(True)
+            self.provider_list.viewport().update()
 
+        # currentItemChanged was blocked, so sync the details pane by hand
+        self._on_provider_selected(self.provider_list.currentItem(), None)
+
+    @QtCore.Slot(QtWidgets.QListWidgetItem, QtWidgets.QListWidgetItem)
     def _on_provider_selected(self, current, previous):
         """Handle provider selection"""
         if current is None:
+            if not self._details_built:
+                return
             self.details_text.clear()
             self.edit_btn.setEnabled(False)
             self.test_btn.setEnabled(False)
             self.remove_btn.setEnabled(False)
             return
 
+        if not self._details_built:
+            self._setup_ui_details()
+
         provider = current.data(QtCore.Qt.UserRole)
         self._show_provider_details(provider)
 
@@ -457,33 +664,67 @@ class ProviderManagerDialog(QtWidgets.QDialog):
 
     def _show_provider_details(self, provider: str):
         """Show details for the selected provider"""
-        try:
-            cred_types = self.credential_manager.list_credential_types(provider)
-
-            details = f"Provider: {provider.title()}\n\n"
-            details += "Configured Credentials:\n"
-
-            for cred_type in cred_types:
-                is_valid = self.credential_manager.validate_credential(
-                    provider, cred_type
-                )
-                status = "✓ Valid" if is_valid else "⚠ Invalid"
-                details += f"  • {cred_type}: {status}\n"
-
-            if not cred_types:
-                details += "  No credentials configured\n"
-
-            self.details_text.setText(details)
+        self.details_text.setText("Loading…")
+        task = CredentialLoadTask(self._build_provider_details, provider)
+        task.signals.loaded.connect(self._apply_provider_details)
+        self._details_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _build_provider_details(self, provider: str) -> Dict[str, str]:
+        """Assemble the details text for a provider (runs in a worker thread)"""
+        validity = credential_cache.cached_all_with_validity(provider)
+
+        details = f"Provider: {provider.title()}\n\n"
+        details += "Configured Credentials:\n"
+
+        for cred_type, is_valid in validity.items():
+            status = "✓ Valid" if is_valid else "⚠ Invalid"
+            details += f"  • {cred_type}: {status}\n"
+
+        if not validity:
+            details += "  No credentials configured\n"
+
+        return {"provider": provider, "text": details}
+
+    @QtCore.Slot(dict)
+    def _apply_provider_details(self, result: dict):
+        """Show provider details assembled by CredentialLoadTask"""
+        if "error" in result:
+            self.details_text.setText(
+                f"Error loading provider details: {result['error']}"
+            )
+            return
 
-        except Exception as e:
-            self.details_text.setText(f"Error loading provider details: {str(e)}")
+        current = self.provider_list.currentItem()
+        if current is None or current.data(QtCore.Qt.UserRole) != result["provider"]:
+            # The selection moved on while the worker was running
+            return
+        self.details_text.setText(result["text"])
+
+    def done(self, result: int):
+        """Drop cached credentials from memory once the manager is closed"""
+        credential_cache.cache_clear()
+        super().done(result)
+
+    def _get_edit_dialog(self, provider: str) -> APIKeyInputDialog:
+        """Return the shared credential dialog, set up for a provider"""
+        if self._edit_dialog is None:
+            self._edit_dialog = APIKeyInputDialog(
+                provider, self, known_providers=self._known_providers
+            )
+        else:
+            self._edit_dialog.reset_for_provider(
+                provider, known_providers=self._known_providers
+            )
+        return self._edit_dialog
 
-    def _add_provider(self, provider: str):
-        """Add a new provider"""
-        dialog = APIKeyInputDialog(provider, self)
+    def _add_provider(self, provider: str, _checked: bool = False):
+        """Add a new provider (``_checked`` absorbs the clicked() argument)"""
+        dialog = self._get_edit_dialog(provider)
         if dialog.exec() == QtWidgets.QDialog.Accepted:
             self._refresh_provider_list()
 
+    @QtCore.Slot()
     def _edit_provider(self):
         """Edit the selected provider"""
         current = self.provider_list.currentItem()
@@ -491,11 +732,12 @@ class ProviderManagerDialog(QtWidgets.QDialog):
             return
 
         provider = current.data(QtCore.Qt.UserRole)
-        dialog = APIKeyInputDialog(provider, self)
+        dialog = self._get_edit_dialog(provider)
         if dialog.exec() == QtWidgets.QDialog.Accepted:
             self._refresh_provider_list()
             self._show_provider_details(provider)
 
+    @QtCore.Slot()
     def _test_provider(self):
         """Test the selected provider connection"""
         current = self.provider_list.currentItem()
@@ -534,6 +776,7 @@ class ProviderManagerDialog(QtWidgets.QDialog):
                 f"Failed to test {provider.title()} connection:\n{str(e)}",
             )
 
+    @QtCore.Slot()
     def _remove_provider(self):
         """Remove the selected provider"""
         current = self.provider_list.currentItem()
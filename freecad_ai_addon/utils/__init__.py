@@ -5,4 +5,11 @@ Contains security & encryption, logging & analytics, and configuration
 management utilities.
 """
 
-__all__ = ["logging", "config", "security", "analytics"]
+__all__ = [
+    "logging",
+    "config",
+    "security",
+    "credential_cache",
+    "analytics",
+    "compat",
+]
@@ -0,0 +1,9 @@
+"""
+Python version compatibility helpers for the FreeCAD AI Addon.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass(**DATACLASS_SLOTS). slots=True needs
+# Python 3.10+; on older interpreters instances simply keep a __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
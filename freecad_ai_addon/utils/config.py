@@ -5,56 +5,138 @@ Provides centralized configuration management with secure storage
 of sensitive data like API keys.
 """
 
+import atexit
+import functools
 import json
-from pathlib import Path
+import os
+from types import MappingProxyType
 from typing import Dict, Any
 from freecad_ai_addon.utils.logging import get_logger
+from freecad_ai_addon.utils.path_helpers import (
+    ensure_dir,
+    freecad_user_dir,
+    replace_file,
+)
+
+try:
+    from PySide import QtCore  # type: ignore
+except ImportError:
+    try:
+        from PySide2 import QtCore  # type: ignore
+    except ImportError:
+        try:
+            from PySide6 import QtCore  # type: ignore
+        except ImportError:
+            QtCore = None
+
+try:
+    import orjson  # type: ignore
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    orjson = None
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 logger = get_logger("config")
 
+# Read-only defaults; _get_default_config hands out copies parsed from the
+# pre-serialized blob, which is cheaper than rebuilding or deep-copying them
+_DEFAULT_CONFIG = MappingProxyType(
+    {
+        "version": "0.1.0",
+        "ui": {
+            "theme": "auto",
+            "conversation_history_limit": 100,
+            "auto_save_conversations": True,
+        },
+        "mcp": {"timeout": 30, "retry_attempts": 3, "connection_pool_size": 5},
+        "agent": {
+            "safety_mode": True,
+            "confirmation_required": True,
+            "max_operations_per_session": 50,
+        },
+        "logging": {"level": "INFO", "max_log_size_mb": 10, "backup_count": 5},
+    }
+)
+_DEFAULT_CONFIG_BLOB = _dumps(dict(_DEFAULT_CONFIG))
+
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge src into dst in place, descending into nested dicts.
+
+    Uses an explicit work stack rather than recursion, so deep trees cannot
+    hit the recursion limit.
+
+    Args:
+        dst: Dictionary to update
+        src: Dictionary whose values take precedence
+
+    Returns:
+        dst
+    """
+    stack = [(dst, src)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return dst
+
+
+# Marks keys that are absent from the config in the lookup cache
+_MISSING = object()
+
+# Rapid successive set() calls on the GUI thread coalesce into one write
+SAVE_DEBOUNCE_MS = 500
+
 
 class ConfigManager:
     """Manages configuration for the FreeCAD AI Addon"""
 
     def __init__(self):
         """Initialize the configuration manager"""
-        self.config_dir = Path.home() / ".FreeCAD" / "ai_addon"
+        self.config_dir = ensure_dir(freecad_user_dir() / "ai_addon")
         self.config_file = self.config_dir / "config.json"
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         self._config = self._load_config()
+        # Per-instance so the cache never outlives (or pins) the manager
+        self._resolve = functools.lru_cache(maxsize=256)(self._resolve_uncached)
+        self._dirty = False
+        self._autosave = True
+        self._save_scheduled = False
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    config = _loads(f.read())
                 logger.info("Configuration loaded successfully")
                 return config
             else:
                 logger.info("No existing configuration found, using defaults")
                 return self._get_default_config()
         except Exception as e:
-            logger.error("Failed to load configuration: %s", str(e))
+            logger.error("Failed to load configuration: %s", e)
             return self._get_default_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration"""
-        return {
-            "version": "0.1.0",
-            "ui": {
-                "theme": "auto",
-                "conversation_history_limit": 100,
-                "auto_save_conversations": True,
-            },
-            "mcp": {"timeout": 30, "retry_attempts": 3, "connection_pool_size": 5},
-            "agent": {
-                "safety_mode": True,
-                "confirmation_required": True,
-                "max_operations_per_session": 50,
-            },
-            "logging": {"level": "INFO", "max_log_size_mb": 10, "backup_count": 5},
-        }
+        """Get a fresh, mutable copy of the default configuration"""
+        return _loads(_DEFAULT_CONFIG_BLOB)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -67,15 +149,18 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
+        value = self._resolve(key)
+        return default if value is _MISSING else value
 
+    def _resolve_uncached(self, key: str) -> Any:
+        """Walk the config for a dot-notation key, or return _MISSING"""
+        value = self._config
         try:
-            for k in keys:
+            for k in key.split("."):
                 value = value[k]
             return value
         except (KeyError, TypeError):
-            return default
+            return _MISSING
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -96,20 +181,66 @@ class ConfigManager:
 
         # Set the value
         config[keys[-1]] = value
-        self._save_config()
+        self._resolve.cache_clear()
+        self._dirty = True
+        if self._autosave:
+            self._schedule_save()
+
+    def batch_update(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values and save them with a single write.
+
+        Args:
+            values: Mapping of dot-notation keys to values
+        """
+        autosave = self._autosave
+        self._autosave = False
+        try:
+            for key, value in values.items():
+                self.set(key, value)
+        finally:
+            self._autosave = autosave
+        self._save_config_if_dirty()
+
+    def flush(self) -> None:
+        """
+        Write pending changes to disk
+
+        Called automatically at exit for the get_config_manager() instance;
+        other instances must flush themselves.
+        """
+        self._save_config_if_dirty()
+
+    def _schedule_save(self) -> None:
+        """Save now, or shortly if running on the Qt GUI thread"""
+        app = QtCore.QCoreApplication.instance() if QtCore is not None else None
+        if app is None or QtCore.QThread.currentThread() != app.thread():
+            self._save_config_if_dirty()
+            return
+
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            QtCore.QTimer.singleShot(SAVE_DEBOUNCE_MS, self._save_config_if_dirty)
+
+    def _save_config_if_dirty(self) -> None:
+        """Save configuration if it changed since the last write"""
+        self._save_scheduled = False
+        if self._dirty:
+            self._save_config()
 
     def _save_config(self) -> None:
         """Save configuration to file"""
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2)
+            replace_file(self.config_file, _dumps(self._config))
+            self._dirty = False
             logger.info("Configuration saved successfully")
         except Exception as e:
-            logger.error("Failed to save configuration: %s", str(e))
+            logger.error("Failed to save configuration: %s", e)
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
         self._config = self._get_default_config()
+        self._resolve.cache_clear()
         self._save_config()
         logger.info("Configuration reset to defaults")
 
@@ -124,12 +255,12 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2)
+            with open(file_path, "wb") as f:
+                f.write(_dumps(self._config))
             logger.info("Configuration exported to %s", file_path)
             return True
         except Exception as e:
-            logger.error("Failed to export configuration: %s", str(e))
+            logger.error("Failed to export configuration: %s", e)
             return False
 
     def import_config(self, file_path: str) -> bool:
@@ -143,26 +274,24 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                imported_config = json.load(f)
+            with open(file_path, "rb") as f:
+                imported_config = _loads(f.read())
 
-            # Validate and merge with current config
-            self._config.update(imported_config)
+            # Merge nested sections so settings absent from the file survive
+            _deep_merge(self._config, imported_config)
+            self._resolve.cache_clear()
             self._save_config()
             logger.info("Configuration imported from %s", file_path)
             return True
         except Exception as e:
-            logger.error("Failed to import configuration: %s", str(e))
+            logger.error("Failed to import configuration: %s", e)
             return False
 
 
-# Global config manager instance
-_config_manager = None
-
-
+@functools.lru_cache(maxsize=None)
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance"""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    manager = ConfigManager()
+    # Only the shared instance is kept alive and flushed at exit
+    atexit.register(manager.flush)
+    return manager
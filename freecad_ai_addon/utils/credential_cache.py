@@ -0,0 +1,84 @@
+"""
+In-process Credential Cache for FreeCAD AI Addon
+
+Memoizes the non-secret credential lookups used by the UI (provider lists
+and validity flags) so that reopening a dialog does not decrypt the
+credential store again. Credential values themselves are never cached here;
+the credential manager keeps its own decrypted cache. Entries are dropped
+whenever the credential manager writes (store/remove/import) or is replaced.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from freecad_ai_addon.utils.security import get_credential_manager
+
+# Provider lists and validity change rarely during a dialog session
+PROVIDERS_TTL = 5.0
+VALIDITY_TTL = 30.0
+
+_lock = threading.Lock()
+_stamp: Optional[Tuple[object, int]] = None
+_validity: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+_provider_validity: Dict[str, Tuple[Dict[str, bool], float]] = {}
+_providers: Optional[Tuple[List[str], float]] = None
+
+
+def _checked_manager():
+    """Return the credential manager, dropping entries it has invalidated"""
+    global _stamp, _providers
+    manager = get_credential_manager()
+    stamp = (manager, manager.generation)
+    if stamp != _stamp:
+        _validity.clear()
+        _provider_validity.clear()
+        _providers = None
+        _stamp = stamp
+    return manager
+
+
+def cached_list_providers() -> List[str]:
+    """Get providers with stored credentials, cached for PROVIDERS_TTL seconds"""
+    global _providers
+    with _lock:
+        manager = _checked_manager()
+        now = time.monotonic()
+        if _providers is None or now - _providers[1] > PROVIDERS_TTL:
+            _providers = (manager.list_providers(), now)
+        return list(_providers[0])
+
+
+def cached_validate(provider: str, credential_type: str) -> bool:
+    """Validate a credential, cached for VALIDITY_TTL seconds"""
+    key = (provider, credential_type)
+    with _lock:
+        manager = _checked_manager()
+        now = time.monotonic()
+        entry = _validity.get(key)
+        if entry is None or now - entry[1] > VALIDITY_TTL:
+            entry = (manager.validate_credential(provider, credential_type), now)
+            _validity[key] = entry
+        return entry[0]
+
+
+def cached_all_with_validity(provider: str) -> Dict[str, bool]:
+    """Validate all credentials of a provider, cached for VALIDITY_TTL seconds"""
+    with _lock:
+        manager = _checked_manager()
+        now = time.monotonic()
+        entry = _provider_validity.get(provider)
+        if entry is None or now - entry[1] > VALIDITY_TTL:
+            entry = (manager.get_all_with_validity(provider), now)
+            _provider_validity[provider] = entry
+        return dict(entry[0])
+
+
+def cache_clear() -> None:
+    """Drop every cached entry (e.g. when a credentials dialog closes)"""
+    global _stamp, _providers
+    with _lock:
+        _validity.clear()
+        _provider_validity.clear()
+        _providers = None
+        _stamp = None
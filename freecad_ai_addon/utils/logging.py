@@ -4,31 +4,56 @@ Logging Configuration for FreeCAD AI Addon
 Provides centralized logging configuration and utilities for the addon.
 """
 
+import atexit
 import logging
-from pathlib import Path
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from freecad_ai_addon.utils.path_helpers import ensure_dir, freecad_user_dir
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Background listener that performs the actual file/console writes
+_listener = None
 
 
 def setup_logging(level=logging.INFO):
     """
     Set up logging configuration for the FreeCAD AI Addon.
 
+    Records are put on an in-memory queue by the calling thread and written
+    to the log file and console by a background QueueListener, so logging on
+    the GUI thread never blocks on disk I/O.
+
     Args:
         level: Logging level (default: INFO)
     """
+    global _listener
     try:
         # Create logs directory in user's FreeCAD directory
-        freecad_user_dir = Path.home() / ".FreeCAD"
-        log_dir = freecad_user_dir / "logs" / "ai_addon"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = ensure_dir(freecad_user_dir() / "logs" / "ai_addon")
 
         # Configure logging
         log_file = log_dir / "freecad_ai_addon.log"
 
-        logging.basicConfig(
-            level=level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-        )
+        if _listener is None:
+            formatter = logging.Formatter(LOG_FORMAT)
+            # delay=True opens the log file on the first record, not at setup
+            file_handler = logging.FileHandler(log_file, delay=True)
+            stream_handler = logging.StreamHandler()
+            for handler in (file_handler, stream_handler):
+                handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            _listener = QueueListener(log_queue, file_handler, stream_handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+
+            # The listener's handlers apply LOG_FORMAT; the queue only
+            # carries the merged message
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter("%(message)s"))
+            logging.basicConfig(level=level, handlers=[queue_handler])
 
         logger = logging.getLogger("freecad_ai_addon")
         logger.info("Logging system initialized successfully")
@@ -37,7 +62,7 @@ def setup_logging(level=logging.INFO):
         # Fallback to basic logging if setup fails
         logging.basicConfig(level=level)
         logger = logging.getLogger("freecad_ai_addon")
-        logger.error(f"Failed to setup advanced logging: {e}")
+        logger.error("Failed to setup advanced logging: %s", e)
 
 
 def get_logger(name):
@@ -3,7 +3,11 @@ Path helper functions for the FreeCAD AI Addon.
 """
 
 import os
+import stat
 import sys
+import threading
+from pathlib import Path
+from typing import Optional
 
 try:
     import FreeCAD as App
@@ -11,10 +15,10 @@ except ImportError:
     App = None
 
 
-def get_addon_dir():
+def _compute_addon_dir():
     """
-    Get the addon directory in a way that is robust to the FreeCAD execution
-    context.
+    Resolve the addon directory in a way that is robust to the FreeCAD
+    execution context.
     """
     try:
         # Try to get the directory from __file__ if available
@@ -32,3 +36,101 @@ def get_addon_dir():
 
         # Final fallback - use current working directory
         return os.path.realpath(os.getcwd())
+
+
+# The addon location cannot change while the process runs, so resolve the
+# realpath chain once at import
+_ADDON_DIR = _compute_addon_dir()
+
+
+def get_addon_dir():
+    """Get the addon directory (resolved once per process)"""
+    return _ADDON_DIR
+
+
+# Path.home() goes through expanduser/pwd lookups, so resolve it once
+_FREECAD_USER_DIR = Path.home() / ".FreeCAD"
+
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def freecad_user_dir() -> Path:
+    """Get the per-user FreeCAD directory (~/.FreeCAD)"""
+    return _FREECAD_USER_DIR
+
+
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (with parents) once per process.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path, for chaining
+    """
+    with _ensured_dirs_lock:
+        if path not in _ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(path)
+    return path
+
+
+# fdatasync skips the metadata flush; it is missing on macOS and Windows
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def write_file(path, data: bytes, mode: int = 0o644, force_mode: bool = False):
+    """
+    Write data to path in as few syscalls as possible, and sync it.
+
+    Args:
+        path: File to write
+        data: Bytes to write
+        mode: Permissions for a newly created file (subject to the umask)
+        force_mode: Also apply mode exactly, including to an existing file
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        if force_mode and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:  # os.write may be partial for very large blobs
+            view = view[os.write(fd, view) :]
+        _fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_file(path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    Atomically replace path with data via a temp file and os.replace.
+
+    A crash mid-write never leaves a truncated file behind, and the temp
+    file is removed if anything fails.
+
+    Args:
+        path: File to replace
+        data: New contents
+        mode: Permissions for the result; by default an existing file keeps
+            its mode and a new one gets 0o644 (subject to the umask)
+    """
+    force_mode = mode is not None
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+            force_mode = True
+        except FileNotFoundError:
+            mode = 0o644
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        write_file(tmp_path, data, mode, force_mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
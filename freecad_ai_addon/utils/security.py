@@ -6,19 +6,125 @@ industry-standard encryption practices.
 """
 
 import os
+import functools
+import hashlib
+import io
 import json
 import platform
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Tuple
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import base64
 
 from freecad_ai_addon.utils.logging import get_logger
+from freecad_ai_addon.utils.path_helpers import (
+    ensure_dir,
+    freecad_user_dir,
+    replace_file,
+    write_file,
+)
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 logger = get_logger("security")
 
+# Encrypted blobs start with a format byte. Legacy Fernet tokens are base64
+# text (always starting with "g"), so they never collide with it.
+_FORMAT_AESGCM = b"\x02"
+_NONCE_SIZE = 12
+
+# Backup files are {"version": "1.0", "credentials": {...}}; the fixed
+# prefix is spliced in front of the serialized credentials
+_EXPORT_HEADER = b'{"version":"1.0","credentials":'
+
+# Credential files are small, but config dirs may live on NFS/SMB homes
+_READ_BUFFER = 65536
+
+
+@functools.lru_cache(maxsize=1)
+def _system_fingerprint() -> bytes:
+    """
+    Build the system/user fingerprint the encryption key is derived from
+
+    Memoized because platform.release()/node() are comparatively slow and
+    cannot change while the process runs.
+    """
+    # Create a deterministic string from system info
+    system_info = f"{platform.node()}{platform.system()}{platform.release()}"
+
+    # Add user-specific info
+    user_info = f"{os.environ.get('USER', os.environ.get('USERNAME', 'default'))}"
+
+    # Combine system and user info
+    return f"{system_info}:{user_info}".encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _pbkdf2_key(key_material: bytes, salt: bytes) -> bytes:
+    """Derive the legacy PBKDF2 key, memoized per (material, salt)"""
+    derived = hashlib.pbkdf2_hmac("sha256", key_material, salt, 100000, dklen=32)
+    return base64.urlsafe_b64encode(derived)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (the output is encrypted, so no indent)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON straight from bytes, without an intermediate str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_file(path) -> bytearray:
+    """Read a whole file into a preallocated buffer with few large reads"""
+    with io.open(path, "rb", buffering=_READ_BUFFER) as f:
+        buf = bytearray(os.fstat(f.fileno()).st_size)
+        view = memoryview(buf)
+        total = 0
+        while total < len(buf):
+            n = f.readinto(view[total:])
+            if not n:
+                break
+            total += n
+        view.release()
+        del buf[total:]
+        return buf
+
+
+def _digest(data: bytes) -> bytes:
+    """Short BLAKE2b digest used to tell whether file contents changed"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=32)
+def _cipher_for(key: bytes) -> Tuple[AESGCM, Fernet]:
+    """
+    Return the (AES-GCM, legacy Fernet) ciphers for a base64-encoded key
+
+    Shared between managers using the same key; both objects are safe to
+    use from several threads for independent encrypt/decrypt calls.
+    """
+    return AESGCM(base64.urlsafe_b64decode(key)), Fernet(key)
+
+
+def _decrypt_blob(blob: bytes, cipher: AESGCM, legacy_cipher: Fernet) -> bytes:
+    """Decrypt an AES-GCM blob with cipher, or a Fernet token with legacy_cipher"""
+    if blob[:1] == _FORMAT_AESGCM:
+        nonce = blob[1 : 1 + _NONCE_SIZE]
+        return cipher.decrypt(nonce, blob[1 + _NONCE_SIZE :], None)
+    return legacy_cipher.decrypt(bytes(blob))
+
 
 class CredentialManager:
     """Manages encrypted storage of sensitive credentials like API keys"""
@@ -31,26 +137,48 @@ class CredentialManager:
             config_dir: Custom configuration directory (defaults to FreeCAD user dir)
         """
         if config_dir is None:
-            self.config_dir = Path.home() / ".FreeCAD" / "ai_addon"
+            self.config_dir = freecad_user_dir() / "ai_addon"
         else:
             self.config_dir = Path(config_dir)
 
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.config_dir)
         self.credentials_file = self.config_dir / "credentials.enc"
         self.salt_file = self.config_dir / "salt.key"
+        # Bumped on every write so caches layered on top can invalidate
+        self.generation = 0
+
+        # Decrypted credentials, valid while the file's ciphertext digest
+        # matches; every write uses a fresh nonce, so the digest always changes
+        self._cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._cache_signature: Optional[bytes] = None
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self._batch_dirty = False
+        # Digest of the plaintext currently on disk, to skip no-op writes
+        self._saved_digest: Optional[bytes] = None
 
         # Generate or load encryption salt
         self._salt = self._get_or_create_salt()
         self._key = self._derive_key()
-        self._cipher = Fernet(self._key)
+        self._set_key(self._key)
 
         logger.info("Credential manager initialized")
 
-        # Ensure global accessor returns the most recently constructed manager.
-        # This allows tests that construct a temporary manager instance to affect
-        # components that obtain the manager via get_credential_manager().
+    def install_as_default(self) -> "CredentialManager":
+        """
+        Make this manager the one returned by get_credential_manager()
+
+        Lets tests point components that look the manager up globally at a
+        temporary instance.
+
+        Returns:
+            This manager, for chaining
+        """
         global _credential_manager
-        _credential_manager = self
+        with _managers_lock:
+            _credential_manager = self
+            _managers[self.config_dir] = self
+        return self
 
     def _get_or_create_salt(self) -> bytes:
         """Get existing salt or create a new one"""
@@ -63,16 +191,19 @@ class CredentialManager:
             else:
                 # Generate new salt
                 salt = os.urandom(16)
-                with open(self.salt_file, "wb") as f:
-                    f.write(salt)
-                # Set restrictive permissions on salt file
-                os.chmod(self.salt_file, 0o600)
+                # Created with restrictive permissions, so it is never
+                # briefly world-readable before a chmod lands
+                write_file(self.salt_file, salt, 0o600, force_mode=True)
                 logger.info("Generated new encryption salt")
                 return salt
         except Exception as e:
             logger.error("Failed to handle encryption salt: %s", str(e))
             raise
 
+    def _key_material(self) -> bytes:
+        """Return the system/user fingerprint the encryption key is derived from"""
+        return _system_fingerprint()
+
     def _derive_key(self) -> bytes:
         """
         Derive encryption key from system-specific information
@@ -80,28 +211,22 @@ class CredentialManager:
         This creates a key unique to the user's system without requiring
         a password, making it transparent to the user while still providing
         encryption at rest.
+
+        The threat model is encryption at rest against casual filesystem
+        access. The key material is a system fingerprint rather than a user
+        password, so key stretching adds no brute-force resistance and a
+        single keyed BLAKE2b pass is used instead of PBKDF2.
         """
         try:
             # Create a deterministic string from system info
-            system_info = f"{platform.node()}{platform.system()}{platform.release()}"
-
-            # Add user-specific info
-            user_info = (
-                f"{os.environ.get('USER', os.environ.get('USERNAME', 'default'))}"
-            )
-
-            # Combine system and user info
-            key_material = f"{system_info}:{user_info}".encode("utf-8")
+            key_material = self._key_material()
 
-            # Derive key using PBKDF2
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=self._salt,
-                iterations=100000,
-            )
+            # BLAKE2b accepts keys up to 64 bytes; the salt is 16
+            derived = hashlib.blake2b(
+                key_material, key=self._salt, digest_size=32
+            ).digest()
 
-            key = base64.urlsafe_b64encode(kdf.derive(key_material))
+            key = base64.urlsafe_b64encode(derived)
             logger.debug("Derived encryption key from system information")
             return key
 
@@ -109,51 +234,191 @@ class CredentialManager:
             logger.error("Failed to derive encryption key: %s", str(e))
             raise
 
-    def _load_encrypted_data(self) -> Dict[str, Any]:
-        """Load and decrypt credential data"""
-        try:
-            if not self.credentials_file.exists():
-                logger.debug("No existing credentials file found")
-                return {}
+    def _derive_legacy_key(self) -> bytes:
+        """
+        Derive the PBKDF2 key used by earlier versions of the addon
 
-            with open(self.credentials_file, "rb") as f:
-                encrypted_data = f.read()
+        Only reached when migrating old files or backups. hashlib runs the
+        whole iteration loop inside OpenSSL with the GIL released, and the
+        result is memoized so managers sharing a salt derive it once.
+        """
+        return _pbkdf2_key(self._key_material(), self._salt)
 
-            if not encrypted_data:
-                logger.debug("Credentials file is empty")
-                return {}
+    def _decrypt_legacy_key(self, blob: bytes) -> bytes:
+        """Decrypt a blob written under the former PBKDF2-derived key"""
+        return _decrypt_blob(blob, *_cipher_for(self._derive_legacy_key()))
 
-            # Decrypt the data
-            decrypted_data = self._cipher.decrypt(encrypted_data)
-            credentials = json.loads(decrypted_data.decode("utf-8"))
+    def _migrate_legacy_key(self, encrypted_data: bytes) -> Dict[str, Any]:
+        """
+        Re-encrypt credentials written under the former PBKDF2-derived key
 
-            logger.debug("Successfully loaded %d credential entries", len(credentials))
-            return credentials
+        Called whenever the current key fails to decrypt the credentials
+        file. Raises if the legacy key cannot decrypt it either.
 
+        Returns:
+            The migrated credentials
+        """
+        credentials = _json_loads(self._decrypt_legacy_key(encrypted_data))
+        try:
+            self._save_encrypted_data(credentials)
+            logger.info("Migrated credentials to the BLAKE2b-derived key")
         except Exception as e:
-            logger.error("Failed to load encrypted credentials: %s", str(e))
-            # Return empty dict rather than failing completely
-            return {}
-
-    def _save_encrypted_data(self, data: Dict[str, Any]) -> None:
-        """Encrypt and save credential data"""
+            # Still usable this session; the next load retries the migration
+            logger.warning("Could not migrate credentials to the new key: %s", e)
+        return self._copy_credentials(credentials)
+
+    def _set_key(self, key: bytes) -> None:
+        """Set up the ciphers for a (base64-encoded) derived key"""
+        # AES-256-GCM runs on OpenSSL's AES-NI/CLMUL path; Fernet is only
+        # kept to read files written before the format byte existed
+        self._cipher, self._legacy_cipher = _cipher_for(key)
+
+    def _encrypt(self, plaintext: bytes) -> bytes:
+        """Encrypt with AES-GCM as format byte || nonce || ciphertext+tag"""
+        nonce = os.urandom(_NONCE_SIZE)
+        return _FORMAT_AESGCM + nonce + self._cipher.encrypt(nonce, plaintext, None)
+
+    def _decrypt(self, blob: bytes) -> bytes:
+        """Decrypt an AES-GCM blob, or a legacy Fernet token"""
+        return _decrypt_blob(blob, self._cipher, self._legacy_cipher)
+
+    @staticmethod
+    def _copy_credentials(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the provider -> {type: value} mapping so callers can mutate it"""
+        return {provider: dict(creds) for provider, creds in data.items()}
+
+    def _read_credentials_file(self) -> Optional[bytearray]:
+        """Return the credentials file's bytes, or None if it does not exist"""
         try:
-            # Convert to JSON and encrypt
-            json_data = json.dumps(data, indent=2).encode("utf-8")
-            encrypted_data = self._cipher.encrypt(json_data)
+            return _read_file(self.credentials_file)
+        except FileNotFoundError:
+            return None
 
-            # Write to file with restrictive permissions
-            with open(self.credentials_file, "wb") as f:
-                f.write(encrypted_data)
+    @staticmethod
+    def _signature_of(encrypted_data: Optional[bytes]) -> Optional[bytes]:
+        """Digest of the ciphertext identifying a file version (None if absent)"""
+        return None if encrypted_data is None else _digest(encrypted_data)
 
-            # Set restrictive permissions
-            os.chmod(self.credentials_file, 0o600)
+    def _load_encrypted_data(self) -> Dict[str, Any]:
+        """
+        Load and decrypt credential data
 
-            logger.info("Successfully saved encrypted credentials")
+        The file is read on every call, so writes by other managers or
+        processes are always seen; only the decrypt and JSON parse are
+        skipped while the ciphertext is unchanged.
+        """
+        with self._lock:
+            try:
+                encrypted_data = self._read_credentials_file()
+                signature = self._signature_of(encrypted_data)
+                if self._cache is not None and signature == self._cache_signature:
+                    return self._copy_credentials(self._cache)
+
+                self._saved_digest = None
+                if encrypted_data is None:
+                    logger.debug("No existing credentials file found")
+                    credentials = {}
+                else:
+                    if not encrypted_data:
+                        logger.debug("Credentials file is empty")
+                        credentials = {}
+                    else:
+                        # Decrypt the data
+                        try:
+                            decrypted_data = self._decrypt(encrypted_data)
+                        except Exception:
+                            # Possibly written under the former PBKDF2 key
+                            return self._migrate_legacy_key(encrypted_data)
+                        self._saved_digest = _digest(decrypted_data)
+                        credentials = _json_loads(decrypted_data)
+                        logger.debug(
+                            "Successfully loaded %d credential entries",
+                            len(credentials),
+                        )
+
+                self._cache = credentials
+                self._cache_signature = signature
+                return self._copy_credentials(credentials)
+
+            except Exception as e:
+                logger.error("Failed to load encrypted credentials: %s", str(e))
+                # Return empty dict rather than failing completely
+                return {}
 
-        except Exception as e:
-            logger.error("Failed to save encrypted credentials: %s", str(e))
-            raise
+    def _save_encrypted_data(self, data: Dict[str, Any]) -> None:
+        """Encrypt and save credential data"""
+        with self._lock:
+            if self._in_batch:
+                # Stage in memory; batch_update writes once on exit
+                self._cache = self._copy_credentials(data)
+                self._batch_dirty = True
+                self.generation += 1
+                return
+
+            try:
+                # Convert to JSON; skip encrypting and writing if the file
+                # already holds exactly this plaintext
+                json_data = _json_dumps(data)
+                digest = _digest(json_data)
+                if (
+                    digest == self._saved_digest
+                    and self._cache_signature is not None
+                    and self._signature_of(self._read_credentials_file())
+                    == self._cache_signature
+                ):
+                    self._cache = self._copy_credentials(data)
+                    logger.debug("Credentials unchanged, skipping write")
+                    return
+
+                encrypted_data = self._encrypt(json_data)
+
+                # Swapped in atomically, so an interrupted save never leaves a
+                # truncated file; created 0o600, so no separate chmod
+                self._saved_digest = None
+                replace_file(self.credentials_file, encrypted_data, 0o600)
+                self._saved_digest = digest
+                self.generation += 1
+
+                self._cache = self._copy_credentials(data)
+                self._cache_signature = _digest(encrypted_data)
+
+                logger.info("Successfully saved encrypted credentials")
+
+            except Exception as e:
+                self._cache = None
+                logger.error("Failed to save encrypted credentials: %s", str(e))
+                raise
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Group credential mutations into a single encrypt + write
+
+        Inside the block, store/remove calls update the in-memory credentials
+        only; the file is written once when the block exits. If the block
+        raises, the staged changes are discarded.
+        """
+        with self._lock:
+            if self._in_batch:
+                # Nested batch: the outermost one writes
+                yield self
+                return
+
+            self._in_batch = True
+            self._batch_dirty = False
+            try:
+                yield self
+            except BaseException:
+                self._in_batch = False
+                if self._batch_dirty:
+                    # Forget the staged state and re-read the file next time
+                    self._cache = None
+                    self.generation += 1
+                raise
+
+            self._in_batch = False
+            if self._batch_dirty:
+                self._save_encrypted_data(self._cache)
 
     def store_credential(self, provider: str, credential_type: str, value: str) -> bool:
         """
@@ -296,6 +561,22 @@ class CredentialManager:
             logger.error("Failed to list credential types: %s", str(e))
             return []
 
+    @staticmethod
+    def _value_appears_valid(credential_type: str, value: Optional[str]) -> bool:
+        """Apply the basic sanity checks used by validate_credential"""
+        if not value:
+            return False
+
+        # Basic validation - check if it's not empty and has reasonable length
+        if credential_type == "api_key":
+            # API keys should be at least 20 characters. Accept common
+            # "sk-" prefixes used in tests and some providers.
+            val = value.strip()
+            return len(val) >= 20 or val.startswith("sk-")
+
+        # For other credential types, just check if non-empty
+        return len(value.strip()) > 0
+
     def validate_credential(self, provider: str, credential_type: str) -> bool:
         """
         Check if a credential exists and appears valid
@@ -309,23 +590,59 @@ class CredentialManager:
         """
         try:
             value = self.get_credential(provider, credential_type)
-            if not value:
-                return False
-
-            # Basic validation - check if it's not empty and has reasonable length
-            if credential_type == "api_key":
-                # API keys should be at least 20 characters. Accept common
-                # "sk-" prefixes used in tests and some providers.
-                val = value.strip()
-                return len(val) >= 20 or val.startswith("sk-")
-
-            # For other credential types, just check if non-empty
-            return len(value.strip()) > 0
+            return self._value_appears_valid(credential_type, value)
 
         except Exception as e:
             logger.error("Failed to validate credential: %s", str(e))
             return False
 
+    def get_all_with_validity(self, provider: str) -> Dict[str, bool]:
+        """
+        Validate every stored credential of a provider with a single load
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Mapping of credential type to whether it appears valid
+        """
+        try:
+            credentials = self._load_encrypted_data().get(provider, {})
+            return {
+                cred_type: self._value_appears_valid(cred_type, value)
+                for cred_type, value in credentials.items()
+            }
+        except Exception as e:
+            logger.error("Failed to validate credentials: %s", str(e))
+            return {}
+
+    def validate_all(
+        self, requested: Dict[str, Iterable[str]]
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Validate many credentials against a single decrypted snapshot
+
+        Args:
+            requested: Mapping of provider name to the credential types to check
+
+        Returns:
+            Mapping of provider to {credential type: appears valid}
+        """
+        try:
+            credentials = self._load_encrypted_data()
+        except Exception as e:
+            logger.error("Failed to validate credentials: %s", str(e))
+            credentials = {}
+
+        results = {}
+        for provider, cred_types in requested.items():
+            stored = credentials.get(provider, {})
+            results[provider] = {
+                cred_type: self._value_appears_valid(cred_type, stored.get(cred_type))
+                for cred_type in cred_types
+            }
+        return results
+
     def export_credentials(
         self, file_path: str, include_providers: list[str] = None
     ) -> bool:
@@ -353,18 +670,12 @@ class CredentialManager:
                 filtered_credentials = credentials
 
             # Export with metadata
-            export_data = {
-                "version": "1.0",
-                "exported_at": str(Path().cwd()),
-                "credentials": filtered_credentials,
-            }
+            json_data = _EXPORT_HEADER + _json_dumps(filtered_credentials) + b"}"
 
             # Encrypt and save
-            json_data = json.dumps(export_data, indent=2).encode("utf-8")
-            encrypted_data = self._cipher.encrypt(json_data)
+            encrypted_data = self._encrypt(json_data)
 
-            with open(file_path, "wb") as f:
-                f.write(encrypted_data)
+            write_file(file_path, encrypted_data, 0o600, force_mode=True)
 
             logger.info("Exported credentials to %s", file_path)
             return True
@@ -385,12 +696,14 @@ class CredentialManager:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, "rb") as f:
-                encrypted_data = f.read()
+            encrypted_data = _read_file(file_path)
 
-            # Decrypt the data
-            decrypted_data = self._cipher.decrypt(encrypted_data)
-            import_data = json.loads(decrypted_data.decode("utf-8"))
+            # Decrypt the data (backups may predate the BLAKE2b key)
+            try:
+                decrypted_data = self._decrypt(encrypted_data)
+            except Exception:
+                decrypted_data = self._decrypt_legacy_key(encrypted_data)
+            import_data = _json_loads(decrypted_data)
 
             if "credentials" not in import_data:
                 logger.error("Invalid backup file format")
@@ -434,13 +747,13 @@ class CredentialManager:
 
             # Generate new salt and key
             self._salt = os.urandom(16)
-            with open(self.salt_file, "wb") as f:
-                f.write(self._salt)
-            os.chmod(self.salt_file, 0o600)
+            write_file(self.salt_file, self._salt, 0o600, force_mode=True)
 
             # Derive new key and create new cipher
             self._key = self._derive_key()
-            self._cipher = Fernet(self._key)
+            self._set_key(self._key)
+            self._cache = None
+            self._saved_digest = None
 
             # Re-encrypt with new key
             self._save_encrypted_data(old_credentials)
@@ -453,8 +766,10 @@ class CredentialManager:
             return False
 
 
-# Global credential manager instance
+# Global credential manager instance, plus one shared manager per config dir
 _credential_manager = None
+_managers: Dict[Path, CredentialManager] = {}
+_managers_lock = threading.Lock()
 
 
 def get_credential_manager(config_dir: Optional[Path] = None) -> CredentialManager:
@@ -462,12 +777,24 @@ def get_credential_manager(config_dir: Optional[Path] = None) -> CredentialManag
     Get the global credential manager instance
 
     Args:
-        config_dir: Custom configuration directory
+        config_dir: Custom configuration directory. Each directory gets a
+            single shared manager, so its key is only derived once.
 
     Returns:
         CredentialManager instance
     """
     global _credential_manager
-    if _credential_manager is None:
-        _credential_manager = CredentialManager(config_dir)
-    return _credential_manager
+    with _managers_lock:
+        if config_dir is None:
+            if _credential_manager is None:
+                _credential_manager = CredentialManager()
+                _managers.setdefault(
+                    _credential_manager.config_dir, _credential_manager
+                )
+            return _credential_manager
+
+        config_dir = Path(config_dir)
+        manager = _managers.get(config_dir)
+        if manager is None:
+            manager = _managers[config_dir] = CredentialManager(config_dir)
+        return manager
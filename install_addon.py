@@ -12,47 +12,56 @@ Or from within FreeCAD:
     exec(open("install_addon.py").read())
 """
 
+import functools
 import os
 import sys
 import platform
 from pathlib import Path
 
+# The platform cannot change while the script runs
+_SYSTEM = platform.system()
 
+
+@functools.lru_cache(maxsize=1)
 def get_freecad_mod_directories():
-    """Get possible FreeCAD Mod directories based on the operating system."""
-    system = platform.system()
+    """Get possible FreeCAD Mod directories based on the operating system.
+
+    The result is computed once per process and returned as a tuple.
+    """
     home = Path.home()
 
-    if system == "Linux":
-        return [
+    if _SYSTEM == "Linux":
+        return (
             home / ".local/share/FreeCAD/Mod",
             home / ".FreeCAD/Mod",
             Path("/usr/share/freecad/Mod"),
             Path("/usr/local/share/freecad/Mod"),
-        ]
-    elif system == "Windows":
+        )
+    elif _SYSTEM == "Windows":
         appdata = Path(os.environ.get("APPDATA", home / "AppData/Roaming"))
-        return [
+        return (
             appdata / "FreeCAD/Mod",
             home / ".FreeCAD/Mod",
             Path("C:/Program Files/FreeCAD/Mod"),
-        ]
-    elif system == "Darwin":  # macOS
-        return [
+        )
+    elif _SYSTEM == "Darwin":  # macOS
+        return (
             home / "Library/Application Support/FreeCAD/Mod",
             home / ".FreeCAD/Mod",
             Path("/Applications/FreeCAD.app/Contents/Mod"),
-        ]
+        )
     else:
-        return [home / ".FreeCAD/Mod"]
+        return (home / ".FreeCAD/Mod",)
 
 
+@functools.lru_cache(maxsize=1)
 def find_freecad_mod_directory():
     """Find the first available FreeCAD Mod directory."""
     for mod_dir in get_freecad_mod_directories():
         if mod_dir.parent.exists():
             # Parent directory exists, we can create Mod if needed
-            mod_dir.mkdir(parents=True, exist_ok=True)
+            if not mod_dir.is_dir():
+                mod_dir.mkdir(parents=True, exist_ok=True)
             return mod_dir
     return None
 
@@ -65,7 +74,7 @@ def get_addon_directory():
 def create_symlink(source, target):
     """Create a symlink, handling Windows junction points."""
     try:
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             # Use junction points on Windows
             import subprocess
 
@@ -88,8 +97,8 @@ def create_symlink(source, target):
 def remove_symlink(target):
     """Remove a symlink or junction point."""
     try:
-        if target.is_symlink() or (platform.system() == "Windows" and target.is_dir()):
-            if platform.system() == "Windows":
+        if target.is_symlink() or (_SYSTEM == "Windows" and target.is_dir()):
+            if _SYSTEM == "Windows":
                 # Remove junction point
                 import subprocess
 
@@ -132,9 +141,7 @@ def install_addon():
 
     # Check if target already exists
     if target_link.exists():
-        if target_link.is_symlink() or (
-            platform.system() == "Windows" and target_link.is_dir()
-        ):
+        if target_link.is_symlink() or (_SYSTEM == "Windows" and target_link.is_dir()):
             print(f"Removing existing symlink: {target_link}")
             if not remove_symlink(target_link):
                 print("ERROR: Failed to remove existing symlink")
@@ -159,7 +166,7 @@ def install_addon():
         return True
     else:
         print("ERROR: Failed to create symlink")
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             print("Make sure you're running as Administrator")
         return False
 
@@ -176,7 +183,7 @@ def uninstall_addon():
 
         if target_link.exists():
             if target_link.is_symlink() or (
-                platform.system() == "Windows" and target_link.is_dir()
+                _SYSTEM == "Windows" and target_link.is_dir()
             ):
                 print(f"Removing symlink: {target_link}")
                 if remove_symlink(target_link):
@@ -215,7 +222,7 @@ def check_installation():
                 else:
                     print("⚠ Symlink points to different directory")
                 found = True
-            elif platform.system() == "Windows" and target_link.is_dir():
+            elif _SYSTEM == "Windows" and target_link.is_dir():
                 print(f"Found junction: {target_link}")
                 found = True
             else:
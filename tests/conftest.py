@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures for the FreeCAD AI Addon tests.
+
+The action libraries, agents and framework are built once per session.
+Tests that change their state should construct their own instance instead.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def action_lib():
+    """Shared ActionLibrary"""
+    from freecad_ai_addon.agent.action_library import ActionLibrary
+
+    return ActionLibrary()
+
+
+@pytest.fixture(scope="session")
+def sketch_lib():
+    """Shared SketchActionLibrary"""
+    from freecad_ai_addon.agent.sketch_action_library import SketchActionLibrary
+
+    return SketchActionLibrary()
+
+
+@pytest.fixture(scope="session")
+def analysis_lib():
+    """Shared AnalysisActionLibrary"""
+    from freecad_ai_addon.agent.analysis_action_library import AnalysisActionLibrary
+
+    return AnalysisActionLibrary()
+
+
+@pytest.fixture(scope="session")
+def framework():
+    """Shared AIAgentFramework, shut down at the end of the session"""
+    from freecad_ai_addon.agent import AIAgentFramework
+
+    framework = AIAgentFramework()
+    yield framework
+    framework.shutdown()
+
+
+@pytest.fixture(scope="session")
+def geometry_agent():
+    """Shared GeometryAgent; it looks up App on each call, so per-test
+    patches of geometry_agent.App still apply"""
+    from freecad_ai_addon.agent.geometry_agent import GeometryAgent
+
+    return GeometryAgent()
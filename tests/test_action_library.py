@@ -5,39 +5,164 @@ This script demonstrates the comprehensive action library capabilities
 for geometric operations, sketch management, and analysis.
 """
 
+import heapq
+import re
 import sys
 import os
-
-from freecad_ai_addon.agent.action_library import ActionLibrary
-from freecad_ai_addon.agent.sketch_action_library import SketchActionLibrary
-from freecad_ai_addon.agent.analysis_action_library import AnalysisActionLibrary
-
-# Add the addon path to Python path for testing
-addon_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if addon_path not in sys.path:
-    sys.path.insert(0, addon_path)
+from types import MappingProxyType
+
+# Substring keywords used to group operations by category
+_GEOM_RE = re.compile(r"create|boolean|pattern")
+_MEAS_RE = re.compile(r"measure|distance|angle")
+_VAL_RE = re.compile(r"validate|check|analysis")
+
+# Read-only operation parameters (the libraries only read them)
+_BOX_PARAMS = MappingProxyType(
+    {"length": 50.0, "width": 30.0, "height": 20.0, "name": "TestBox"}
+)
+_SKETCH_PARAMS = MappingProxyType({"name": "TestSketch", "plane": "XY_Plane"})
+_PRINT_PARAMS = MappingProxyType(
+    {
+        "obj_name": "TestObject",
+        "layer_height": 0.2,
+        "nozzle_diameter": 0.4,
+        "max_overhang_angle": 45.0,
+    }
+)
+_WALL_PARAMS = MappingProxyType(
+    {
+        "obj_name": "TestObject",
+        "min_thickness": 1.0,
+        "max_thickness": 10.0,
+    }
+)
+_CONSTRAINT_PARAMS = MappingProxyType({"sketch_name": "TestSketch", "geometry_id": 0})
+_DISTANCE_PARAMS = MappingProxyType(
+    {
+        "sketch_name": "TestSketch",
+        "geometry_id1": 0,
+        "point_pos1": 1,
+        "geometry_id2": 1,
+        "point_pos2": 1,
+        "distance": 25.0,
+    }
+)
+_HELIX_PARAMS = MappingProxyType(
+    {"pitch": 5.0, "height": 50.0, "radius": 10.0, "name": "TestHelix"}
+)
+_BOOLEAN_PARAMS = MappingProxyType({"objects": ["Box1", "Box2"], "name": "UnionResult"})
+
+# Fixed report text, printed with one call each
+_FEATURES_SUMMARY = """
+=== Action Library Test Complete ===
+
+Action Library Features Successfully Tested:
+✓ Comprehensive geometric primitive creation
+✓ Advanced boolean operations
+✓ Modification features (fillets, chamfers)
+✓ Pattern and array operations
+✓ Complete sketch management system
+✓ Constraint handling and validation
+✓ Manufacturing analysis (3D printing, injection molding)
+✓ Geometric validation and quality checking
+✓ Measurement and distance calculation
+✓ Operation history and state tracking
+✓ Parameter validation and error handling"""
+
+_USAGE_EXAMPLES = """
+=== Real-World Usage Examples ===
+
+Example 1: Mounting Bracket Creation Process
+Operation sequence that would be executed:
+  1. create_box(length=50, width=30, height=5) -> Base plate
+  2. create_sketch(plane='XY_Plane') -> Hole pattern sketch
+  3. add_circle(center=(10,10), radius=3.25) -> M6 hole
+  4. add_circle(center=(40,10), radius=3.25) -> M6 hole
+  5. add_circle(center=(25,20), radius=3.25) -> M6 hole
+  6. create_extrusion(sketch='HoleSketch', direction=-5) -> Cut holes
+  7. boolean_difference(base='BasePlate', tool='Holes')
+  8. add_chamfer(edges=[all_top_edges], size=1.0)
+  9. analyze_3d_printability() -> Check manufacturability
+
+Example 2: Design Validation Workflow
+Validation sequence:
+  1. validate_geometry() -> Check geometric integrity
+  2. analyze_wall_thickness(min=1.5) -> Manufacturing check
+  3. check_intersections() -> Assembly validation
+  4. analyze_draft_angles(min_angle=2.0) -> Molding check
+  5. measure_distance() -> Dimensional verification
+  6. calculate_volume() -> Material usage
+  7. analyze_mass_properties(density=2.7) -> Weight analysis
+
+Example 3: Parametric Design Pattern
+Parameter-driven operations:
+  1. Parameters: length=var, width=var, hole_count=var
+  2. create_box(length=length, width=width, height=10)
+  3. For i in range(hole_count):
+     - add_circle(center=(spacing*i, width/2), radius=hole_size)
+  4. fully_constrain_sketch() -> Automatic constraints
+  5. validate_sketch() -> Check constraint conflicts
+
+=== Usage Examples Complete ==="""
+
+_COMPLETION_BANNER = """
+============================================================
+🎉 ACTION LIBRARY IMPLEMENTATION COMPLETE! 🎉
+============================================================
+
+The FreeCAD AI Addon now includes:
+• Comprehensive Action Library with 30+ geometric operations
+• Advanced Sketch Action Library with constraint management
+• Manufacturing Analysis Library with 3D printing support
+• Geometric validation and quality checking
+• Measurement and analysis capabilities
+• Parameter validation and error handling
+• Operation history and state management
+
+Next steps:
+• Integration with AI Agent Framework
+• Natural language operation parsing
+• Advanced task planning and execution
+• Real-time manufacturing guidance"""
+
+
+# What a library call may raise when FreeCAD is missing or App is None;
+# anything else is a real failure and propagates
+_FREECAD_UNAVAILABLE = (ImportError, AttributeError)
+
+
+def _try_run(label, reason, fn, *args):
+    """Run one library call and print its status, or why it failed"""
+    try:
+        result = fn(*args)
+    except _FREECAD_UNAVAILABLE as e:
+        print(f"   Expected failure ({reason}): {type(e).__name__}")
+        return
+    assert isinstance(result, dict), f"{label}: expected a result dict"
+    assert "status" in result, f"{label}: result has no status"
+    print(f"   {label}: {result['status']}")
 
 
-def test_action_libraries():
-    """Test the comprehensive action libraries"""
+def test_action_libraries(action_lib, sketch_lib, analysis_lib):
+    """Test the comprehensive action libraries
 
+    The libraries come from the session fixtures in conftest.py, or are
+    built by the ``__main__`` block when run as a script.
+    """
     print("=== FreeCAD AI Addon Action Library Test ===\n")
 
     # Initialize action libraries
     print("1. Initializing Action Libraries...")
 
     try:
-        action_lib = ActionLibrary()
-        sketch_lib = SketchActionLibrary()
-        analysis_lib = AnalysisActionLibrary()
+        # Fetched once and reused by the sections below
+        all_ops = action_lib.get_available_operations()
+        sketch_ops = sketch_lib.sketch_operations
+        analysis_ops = analysis_lib.analysis_operations
 
-        print(
-            f"   ✓ Action Library: {len(action_lib.get_available_operations())} operations"
-        )
-        print(f"   ✓ Sketch Library: {len(sketch_lib.sketch_operations)} operations")
-        print(
-            f"   ✓ Analysis Library: {len(analysis_lib.analysis_operations)} operations"
-        )
+        print(f"   ✓ Action Library: {len(all_ops)} operations")
+        print(f"   ✓ Sketch Library: {len(sketch_ops)} operations")
+        print(f"   ✓ Analysis Library: {len(analysis_ops)} operations")
 
     except Exception as e:
         print(f"   ✗ Failed to initialize libraries: {e}")
@@ -46,62 +171,44 @@ def test_action_libraries():
     # Test operation discovery
     print("\n2. Testing Operation Discovery...")
 
-    print("   Available Geometric Operations:")
-    for op in sorted(action_lib.get_available_operations())[:10]:  # Show first 10
-        print(f"      - {op}")
-
-    print("   Available Sketch Operations:")
-    for op in sorted(list(sketch_lib.sketch_operations.keys()))[:10]:  # Show first 10
-        print(f"      - {op}")
-
-    print("   Available Analysis Operations:")
-    for op in sorted(list(analysis_lib.analysis_operations.keys()))[
-        :10
-    ]:  # Show first 10
-        print(f"      - {op}")
+    # Show the first 10 of each, without sorting the whole registry
+    out = []
+    for title, ops in (
+        ("Geometric", all_ops),
+        ("Sketch", sketch_ops),
+        ("Analysis", analysis_ops),
+    ):
+        out.append(f"   Available {title} Operations:")
+        out.extend(f"      - {op}" for op in heapq.nsmallest(10, ops))
+    print("\n".join(out))
 
     # Test parameter validation (without FreeCAD)
     print("\n3. Testing Parameter Validation...")
 
     # Test box creation parameters
-    box_params = {"length": 50.0, "width": 30.0, "height": 20.0, "name": "TestBox"}
-
-    try:
-        # This will fail without FreeCAD, but we can test the structure
-        result = action_lib.execute_operation("box", box_params)
-        print(f"   Box creation result: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no FreeCAD): {type(e).__name__}")
+    _try_run(
+        "Box creation result",
+        "no FreeCAD",
+        action_lib.execute_operation,
+        "box",
+        _BOX_PARAMS,
+    )
 
     # Test sketch parameters
-    sketch_params = {"name": "TestSketch", "plane": "XY_Plane"}
-
-    try:
-        result = sketch_lib.execute_sketch_operation("create_sketch", sketch_params)
-        print(f"   Sketch creation result: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no FreeCAD): {type(e).__name__}")
+    _try_run(
+        "Sketch creation result",
+        "no FreeCAD",
+        sketch_lib.execute_sketch_operation,
+        "create_sketch",
+        _SKETCH_PARAMS,
+    )
 
     print("\n4. Testing Advanced Operation Categories...")
 
     # Group operations by category
-    geometric_ops = [
-        op
-        for op in action_lib.get_available_operations()
-        if any(keyword in op for keyword in ["create", "boolean", "pattern"])
-    ]
-
-    measurement_ops = [
-        op
-        for op in analysis_lib.analysis_operations.keys()
-        if any(keyword in op for keyword in ["measure", "distance", "angle"])
-    ]
-
-    validation_ops = [
-        op
-        for op in analysis_lib.analysis_operations.keys()
-        if any(keyword in op for keyword in ["validate", "check", "analysis"])
-    ]
+    geometric_ops = [op for op in all_ops if _GEOM_RE.search(op)]
+    measurement_ops = [op for op in analysis_ops if _MEAS_RE.search(op)]
+    validation_ops = [op for op in analysis_ops if _VAL_RE.search(op)]
 
     print(f"   Geometric Operations: {len(geometric_ops)}")
     print(f"   Measurement Operations: {len(measurement_ops)}")
@@ -110,82 +217,62 @@ def test_action_libraries():
     print("\n5. Testing Manufacturing Analysis Features...")
 
     # Test 3D printing analysis parameters
-    print_params = {
-        "obj_name": "TestObject",
-        "layer_height": 0.2,
-        "nozzle_diameter": 0.4,
-        "max_overhang_angle": 45.0,
-    }
-
-    try:
-        result = analysis_lib.execute_analysis("printability_analysis", print_params)
-        print(f"   3D Printability analysis: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no object): {type(e).__name__}")
+    _try_run(
+        "3D Printability analysis",
+        "no object",
+        analysis_lib.execute_analysis,
+        "printability_analysis",
+        _PRINT_PARAMS,
+    )
 
     # Test wall thickness analysis
-    wall_params = {
-        "obj_name": "TestObject",
-        "min_thickness": 1.0,
-        "max_thickness": 10.0,
-    }
-
-    try:
-        result = analysis_lib.execute_analysis("wall_thickness_analysis", wall_params)
-        print(f"   Wall thickness analysis: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no object): {type(e).__name__}")
+    _try_run(
+        "Wall thickness analysis",
+        "no object",
+        analysis_lib.execute_analysis,
+        "wall_thickness_analysis",
+        _WALL_PARAMS,
+    )
 
     print("\n6. Testing Constraint Management...")
 
     # Test constraint addition
-    constraint_params = {"sketch_name": "TestSketch", "geometry_id": 0}
-
-    try:
-        result = sketch_lib.execute_sketch_operation(
-            "add_horizontal_constraint", constraint_params
-        )
-        print(f"   Horizontal constraint: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no sketch): {type(e).__name__}")
+    _try_run(
+        "Horizontal constraint",
+        "no sketch",
+        sketch_lib.execute_sketch_operation,
+        "add_horizontal_constraint",
+        _CONSTRAINT_PARAMS,
+    )
 
     # Test distance constraint
-    distance_params = {
-        "sketch_name": "TestSketch",
-        "geometry_id1": 0,
-        "point_pos1": 1,
-        "geometry_id2": 1,
-        "point_pos2": 1,
-        "distance": 25.0,
-    }
-
-    try:
-        result = sketch_lib.execute_sketch_operation(
-            "add_distance_constraint", distance_params
-        )
-        print(f"   Distance constraint: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no sketch): {type(e).__name__}")
+    _try_run(
+        "Distance constraint",
+        "no sketch",
+        sketch_lib.execute_sketch_operation,
+        "add_distance_constraint",
+        _DISTANCE_PARAMS,
+    )
 
     print("\n7. Testing Advanced Geometric Features...")
 
     # Test helix creation
-    helix_params = {"pitch": 5.0, "height": 50.0, "radius": 10.0, "name": "TestHelix"}
-
-    try:
-        result = action_lib.execute_operation("helix", helix_params)
-        print(f"   Helix creation: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no FreeCAD): {type(e).__name__}")
+    _try_run(
+        "Helix creation",
+        "no FreeCAD",
+        action_lib.execute_operation,
+        "helix",
+        _HELIX_PARAMS,
+    )
 
     # Test boolean operations
-    boolean_params = {"objects": ["Box1", "Box2"], "name": "UnionResult"}
-
-    try:
-        result = action_lib.execute_operation("union", boolean_params)
-        print(f"   Boolean union: {result['status']}")
-    except Exception as e:
-        print(f"   Expected failure (no objects): {type(e).__name__}")
+    _try_run(
+        "Boolean union",
+        "no objects",
+        action_lib.execute_operation,
+        "union",
+        _BOOLEAN_PARAMS,
+    )
 
     print("\n8. Testing Operation History and State Management...")
 
@@ -196,19 +283,7 @@ def test_action_libraries():
     print(f"   Created Objects: {len(action_lib.created_objects)}")
     print(f"   Modified Objects: {len(action_lib.modified_objects)}")
 
-    print("\n=== Action Library Test Complete ===")
-    print("\nAction Library Features Successfully Tested:")
-    print("✓ Comprehensive geometric primitive creation")
-    print("✓ Advanced boolean operations")
-    print("✓ Modification features (fillets, chamfers)")
-    print("✓ Pattern and array operations")
-    print("✓ Complete sketch management system")
-    print("✓ Constraint handling and validation")
-    print("✓ Manufacturing analysis (3D printing, injection molding)")
-    print("✓ Geometric validation and quality checking")
-    print("✓ Measurement and distance calculation")
-    print("✓ Operation history and state tracking")
-    print("✓ Parameter validation and error handling")
+    print(_FEATURES_SUMMARY)
 
     # Test passed
     assert True
@@ -217,51 +292,26 @@ def test_action_libraries():
 def demonstrate_real_world_usage():
     """Demonstrate real-world usage patterns"""
 
-    print("\n=== Real-World Usage Examples ===\n")
-
-    # Example 1: Creating a mounting bracket
-    print("Example 1: Mounting Bracket Creation Process")
-    print("Operation sequence that would be executed:")
-    print("  1. create_box(length=50, width=30, height=5) -> Base plate")
-    print("  2. create_sketch(plane='XY_Plane') -> Hole pattern sketch")
-    print("  3. add_circle(center=(10,10), radius=3.25) -> M6 hole")
-    print("  4. add_circle(center=(40,10), radius=3.25) -> M6 hole")
-    print("  5. add_circle(center=(25,20), radius=3.25) -> M6 hole")
-    print("  6. create_extrusion(sketch='HoleSketch', direction=-5) -> Cut holes")
-    print("  7. boolean_difference(base='BasePlate', tool='Holes')")
-    print("  8. add_chamfer(edges=[all_top_edges], size=1.0)")
-    print("  9. analyze_3d_printability() -> Check manufacturability")
-
-    # Example 2: Design validation workflow
-    print("\nExample 2: Design Validation Workflow")
-    print("Validation sequence:")
-    print("  1. validate_geometry() -> Check geometric integrity")
-    print("  2. analyze_wall_thickness(min=1.5) -> Manufacturing check")
-    print("  3. check_intersections() -> Assembly validation")
-    print("  4. analyze_draft_angles(min_angle=2.0) -> Molding check")
-    print("  5. measure_distance() -> Dimensional verification")
-    print("  6. calculate_volume() -> Material usage")
-    print("  7. analyze_mass_properties(density=2.7) -> Weight analysis")
-
-    # Example 3: Parametric design pattern
-    print("\nExample 3: Parametric Design Pattern")
-    print("Parameter-driven operations:")
-    print("  1. Parameters: length=var, width=var, hole_count=var")
-    print("  2. create_box(length=length, width=width, height=10)")
-    print("  3. For i in range(hole_count):")
-    print("     - add_circle(center=(spacing*i, width/2), radius=hole_size)")
-    print("  4. fully_constrain_sketch() -> Automatic constraints")
-    print("  5. validate_sketch() -> Check constraint conflicts")
-
-    print("\n=== Usage Examples Complete ===")
+    print(_USAGE_EXAMPLES)
 
 
 if __name__ == "__main__":
+    # Add the addon path to Python path when run as a script
+    addon_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if addon_path not in sys.path:
+        sys.path.insert(0, addon_path)
+
     print("Starting FreeCAD AI Addon Action Library Tests...")
 
+    from freecad_ai_addon.agent.action_library import ActionLibrary
+    from freecad_ai_addon.agent.sketch_action_library import SketchActionLibrary
+    from freecad_ai_addon.agent.analysis_action_library import AnalysisActionLibrary
+
     # Run comprehensive tests
     try:
-        test_action_libraries()
+        test_action_libraries(
+            ActionLibrary(), SketchActionLibrary(), AnalysisActionLibrary()
+        )
         success = True
     except AssertionError as e:
         print(f"Tests failed: {e}")
@@ -271,22 +321,7 @@ if __name__ == "__main__":
         # Show real-world usage examples
         demonstrate_real_world_usage()
 
-        print("\n" + "=" * 60)
-        print("🎉 ACTION LIBRARY IMPLEMENTATION COMPLETE! 🎉")
-        print("=" * 60)
-        print("\nThe FreeCAD AI Addon now includes:")
-        print("• Comprehensive Action Library with 30+ geometric operations")
-        print("• Advanced Sketch Action Library with constraint management")
-        print("• Manufacturing Analysis Library with 3D printing support")
-        print("• Geometric validation and quality checking")
-        print("• Measurement and analysis capabilities")
-        print("• Parameter validation and error handling")
-        print("• Operation history and state management")
-        print("\nNext steps:")
-        print("• Integration with AI Agent Framework")
-        print("• Natural language operation parsing")
-        print("• Advanced task planning and execution")
-        print("• Real-time manufacturing guidance")
+        print(_COMPLETION_BANNER)
 
     else:
         print("\n❌ Some tests failed. Check implementation.")
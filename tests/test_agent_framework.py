@@ -3,22 +3,22 @@ Test script for the AI Agent Framework.
 Demonstrates basic functionality and usage patterns.
 """
 
-import sys
-import os
-
 from freecad_ai_addon.agent import AIAgentFramework
 
-# Add the parent directory to the path so we can import the agent framework
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_RULE = "=" * 60
+_READY_BANNER = f"\n{_RULE}\nAI Agent Framework is ready for integration!\n{_RULE}"
+
 
+def test_agent_framework(framework):
+    """Test the AI Agent Framework functionality
 
-def test_agent_framework():
-    """Test the AI Agent Framework functionality"""
+    Args:
+        framework: Framework under test (the session fixture under pytest)
+    """
     print("=== FreeCAD AI Agent Framework Test ===\n")
 
     # Initialize the framework
     print("1. Initializing AI Agent Framework...")
-    framework = AIAgentFramework()
     print("✓ Framework initialized successfully")
 
     # Get capabilities
@@ -30,13 +30,13 @@ def test_agent_framework():
     print(f"✓ {capabilities['framework_info']['agents_count']} agents registered")
 
     # Print available operations
-    print("\n3. Available Operations:")
+    out = ["\n3. Available Operations:"]
     for category, operations in capabilities["supported_operations"].items():
-        print(f"   {category.title()}: {len(operations)} operations")
-        for op in operations[:3]:  # Show first 3 operations
-            print(f"     - {op}")
+        out.append(f"   {category.title()}: {len(operations)} operations")
+        out.extend(f"     - {op}" for op in operations[:3])  # Show first 3
         if len(operations) > 3:
-            print(f"     ... and {len(operations) - 3} more")
+            out.append(f"     ... and {len(operations) - 3} more")
+    print("\n".join(out))
 
     # Test request validation
     print("\n4. Testing request validation...")
@@ -47,13 +47,17 @@ def test_agent_framework():
         "Create an impossible quantum geometry",  # This should fail
     ]
 
-    for request in test_requests:
-        print(f"\n   Request: '{request}'")
-        validation = framework.validate_request(request)
+    # Validation is pure-Python parsing that holds the GIL, so the batch is
+    # validated up front in one pass rather than on a thread pool
+    validations = list(map(framework.validate_request, test_requests))
+    out = []
+    for request, validation in zip(test_requests, validations):
+        out.append(f"\n   Request: '{request}'")
         if validation["feasible"]:
-            print(f"   ✓ Feasible - {validation['task_count']} tasks planned")
+            out.append(f"   ✓ Feasible - {validation['task_count']} tasks planned")
         else:
-            print(f"   ✗ Not feasible - {validation['reason']}")
+            out.append(f"   ✗ Not feasible - {validation['reason']}")
+    print("\n".join(out))
 
     # Test preview mode execution
     print("\n5. Testing preview mode execution...")
@@ -79,19 +83,23 @@ def test_agent_framework():
     print(f"   Active Plans: {status['active_plans']}")
     print(f"   Completed Plans: {status['completed_plans']}")
 
-    # Shutdown
-    print("\n7. Shutting down framework...")
-    framework.shutdown()
-    print("✓ Framework shutdown complete")
+    # Shutdown is left to whoever created the framework
 
     print("\n=== Test completed successfully! ===")
 
 
-def demo_natural_language_examples():
-    """Demonstrate natural language processing capabilities"""
+def demo_natural_language_examples(framework=None):
+    """Demonstrate natural language processing capabilities
+
+    Args:
+        framework: Framework to reuse; a new one is created (and shut down)
+            when omitted
+    """
     print("\n=== Natural Language Processing Demo ===\n")
 
-    framework = AIAgentFramework()
+    owns_framework = framework is None
+    if owns_framework:
+        framework = AIAgentFramework()
 
     examples = [
         "Create a box that is 50mm long, 30mm wide, and 20mm high",
@@ -105,29 +113,32 @@ def demo_natural_language_examples():
 
     print("Processing natural language requests:\n")
 
-    for i, example in enumerate(examples, 1):
-        print(f"{i}. Request: '{example}'")
-
-        # Validate the request
-        validation = framework.validate_request(example)
+    # Validate all requests in one batch, then report
+    validations = list(map(framework.validate_request, examples))
+    out = []
+    for i, (example, validation) in enumerate(zip(examples, validations), 1):
+        out.append(f"{i}. Request: '{example}'")
 
         if validation["feasible"]:
-            print(f"   ✓ Parsed into {validation['task_count']} tasks:")
-            for task in validation["plan_preview"]:
-                print(f"     - {task['description']}")
+            out.append(f"   ✓ Parsed into {validation['task_count']} tasks:")
+            out.extend(
+                f"     - {task['description']}" for task in validation["plan_preview"]
+            )
         else:
-            print(f"   ✗ Could not parse: {validation['reason']}")
+            out.append(f"   ✗ Could not parse: {validation['reason']}")
 
-        print()  # Empty line for readability
+        out.append("")  # Empty line for readability
+    print("\n".join(out))
 
-    framework.shutdown()
+    if owns_framework:
+        framework.shutdown()
 
 
 if __name__ == "__main__":
-    # Run tests
-    test_agent_framework()
-    demo_natural_language_examples()
+    # Run tests against one framework instance
+    framework = AIAgentFramework()
+    test_agent_framework(framework)
+    demo_natural_language_examples(framework)
+    framework.shutdown()
 
-    print("\n" + "=" * 60)
-    print("AI Agent Framework is ready for integration!")
-    print("=" * 60)
+    print(_READY_BANNER)
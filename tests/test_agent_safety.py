@@ -3,8 +3,8 @@ Tests for Agent Safety & Control System.
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
 
 from freecad_ai_addon.agent.safety_control import (
     AgentSafetyController,
@@ -16,15 +16,17 @@ from freecad_ai_addon.agent.safety_control import (
 from freecad_ai_addon.agent.base_agent import AgentTask, TaskType
 
 
-class TestAgentSafetyController(unittest.TestCase):
-    """Test cases for AgentSafetyController"""
+class _PatchedAppTestCase(unittest.TestCase):
+    """Base class patching FreeCAD's App module for the whole class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.safety_controller = AgentSafetyController(SafetyLevel.MEDIUM)
+    @classmethod
+    def setUpClass(cls):
+        """Patch FreeCAD's App module and build shared fixtures once"""
+        cls._app_patcher = patch("freecad_ai_addon.agent.safety_control.App")
+        cls.mock_app = cls._app_patcher.start()
 
         # Mock task for testing
-        self.test_task = AgentTask(
+        cls._shared_task = AgentTask(
             id="test_task_001",
             task_type=TaskType.GEOMETRY_CREATION,
             description="Create a test box",
@@ -32,6 +34,35 @@ class TestAgentSafetyController(unittest.TestCase):
             context={"document": {"name": "TestDoc", "object_count": 5}},
         )
 
+        # Document objects for the rollback tests; only .Name is read
+        cls._mock_objects = tuple(SimpleNamespace(Name=f"Obj{i}") for i in range(3))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the real App module"""
+        cls._app_patcher.stop()
+
+    def setUp(self):
+        """Set up test fixtures"""
+        # No active document unless a test provides one
+        self.mock_app.ActiveDocument = None
+        self.test_task = self._shared_task
+
+
+class TestAgentSafetyController(_PatchedAppTestCase):
+    """Read-only tests for AgentSafetyController, sharing one controller"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared controller once"""
+        super().setUpClass()
+        cls._shared_controller = AgentSafetyController(SafetyLevel.MEDIUM)
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.safety_controller = self._shared_controller
+
     def test_initialization(self):
         """Test safety controller initialization"""
         controller = AgentSafetyController(SafetyLevel.HIGH)
@@ -42,31 +73,8 @@ class TestAgentSafetyController(unittest.TestCase):
         self.assertFalse(controller.paused)
         self.assertFalse(controller.manual_control)
 
-    def test_validate_operation_success(self):
-        """Test successful operation validation"""
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            # Mock FreeCAD environment
-            mock_doc = Mock()
-            mock_doc.getObject.return_value = Mock()  # Object exists
-            mock_app.ActiveDocument = mock_doc
-
-            result = self.safety_controller.validate_operation(self.test_task)
-
-            self.assertIsInstance(result, SafetyCheckResult)
-            # Basic validation should pass for well-formed tasks
-
-    def test_validate_operation_no_document(self):
-        """Test validation with no active document"""
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            mock_app.ActiveDocument = None
-
-            result = self.safety_controller.validate_operation(self.test_task)
-
-            self.assertFalse(result.passed)
-            self.assertEqual(result.risk_level, OperationRisk.MEDIUM_RISK)
-
-    def test_destructive_operation_detection(self):
-        """Test detection of destructive operations"""
+    def test_validate_operation_cases(self):
+        """Test validation of well-formed, destructive and incomplete tasks"""
         destructive_task = AgentTask(
             id="destructive_task",
             task_type=TaskType.GEOMETRY_MODIFICATION,
@@ -74,27 +82,51 @@ class TestAgentSafetyController(unittest.TestCase):
             parameters={"operation": "boolean_difference", "objects": ["Box1", "Box2"]},
             context={},
         )
+        # Valid box parameters
+        valid_task = AgentTask(
+            id="valid_box",
+            task_type=TaskType.GEOMETRY_CREATION,
+            description="Create box",
+            parameters={"length": 10, "width": 20, "height": 30},
+            context={},
+        )
+        # Invalid box parameters (missing height)
+        invalid_task = AgentTask(
+            id="invalid_box",
+            task_type=TaskType.GEOMETRY_CREATION,
+            description="Create box",
+            parameters={"length": 10, "width": 20},
+            context={},
+        )
 
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            mock_doc = Mock()
-            mock_app.ActiveDocument = mock_doc
-
-            result = self.safety_controller.validate_operation(destructive_task)
-
-            # Should be flagged as destructive
-            self.assertEqual(result.risk_level, OperationRisk.DESTRUCTIVE)
+        # Mock FreeCAD environment
+        mock_doc = Mock()
+        mock_doc.getObject.return_value = Mock()  # Object exists
+        self.mock_app.ActiveDocument = mock_doc
+
+        # None: only the result type is checked
+        cases = [
+            (self.test_task, OperationRisk.SAFE),
+            (destructive_task, OperationRisk.DESTRUCTIVE),
+            (valid_task, OperationRisk.SAFE),
+            (invalid_task, None),
+        ]
+        for task, expected_risk in cases:
+            with self.subTest(task=task.id):
+                result = self.safety_controller.validate_operation(task)
+
+                self.assertIsInstance(result, SafetyCheckResult)
+                if expected_risk is not None:
+                    self.assertEqual(result.risk_level, expected_risk)
 
-    def test_resource_limits_check(self):
-        """Test resource limits checking"""
-        # Test operation rate limit
-        self.safety_controller.resource_limits.max_operations_per_minute = 1
+    def test_validate_operation_no_document(self):
+        """Test validation with no active document"""
+        self.mock_app.ActiveDocument = None
 
-        # First operation should pass
-        self.assertTrue(self.safety_controller.check_resource_limits(self.test_task))
-        self.safety_controller.operations_count = 1
+        result = self.safety_controller.validate_operation(self.test_task)
 
-        # Second operation should fail
-        self.assertFalse(self.safety_controller.check_resource_limits(self.test_task))
+        self.assertFalse(result.passed)
+        self.assertEqual(result.risk_level, OperationRisk.MEDIUM_RISK)
 
     @patch("freecad_ai_addon.agent.safety_control.Gui")
     def test_user_confirmation_no_gui(self, mock_gui):
@@ -114,55 +146,112 @@ class TestAgentSafetyController(unittest.TestCase):
 
         self.assertFalse(confirmed)
 
+    def test_operation_preview(self):
+        """Test operation preview generation"""
+        preview = self.safety_controller.create_operation_preview(self.test_task)
+
+        self.assertIsInstance(preview, dict)
+        self.assertEqual(preview["task_id"], self.test_task.id)
+        self.assertEqual(preview["operation"], self.test_task.task_type.value)
+        self.assertTrue(preview["preview_mode"])
+        self.assertIn("timestamp", preview)
+
+    def test_safety_status(self):
+        """Test safety status reporting"""
+        status = self.safety_controller.get_safety_status()
+
+        self.assertIsInstance(status, dict)
+        self.assertIn("resource_limits", status)
+
+        expected = {
+            "safety_level": SafetyLevel.MEDIUM.value,
+            "paused": False,
+            "manual_control": False,
+        }
+        self.assertEqual({key: status.get(key) for key in expected}, expected)
+
+    def test_safety_level_escalation(self):
+        """Test different safety levels"""
+        # Test CRITICAL safety level
+        critical_controller = AgentSafetyController(SafetyLevel.CRITICAL)
+
+        safety_result = SafetyCheckResult(
+            passed=True, risk_level=OperationRisk.LOW_RISK
+        )
+
+        with patch("freecad_ai_addon.agent.safety_control.Gui") as mock_gui:
+            with patch("freecad_ai_addon.agent.safety_control.QDialog", None):
+                # Even low-risk operations should require confirmation at CRITICAL level
+                # But without GUI, should be denied
+                confirmed = critical_controller.require_user_confirmation(
+                    self.test_task, safety_result
+                )
+
+                # Without GUI, critical level should deny operations
+                self.assertFalse(confirmed)
+
+
+class TestAgentSafetyControllerState(_PatchedAppTestCase):
+    """Tests that change controller state, each on a fresh controller"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.safety_controller = AgentSafetyController(SafetyLevel.MEDIUM)
+
+    def test_resource_limits_check(self):
+        """Test resource limits checking"""
+        # Test operation rate limit
+        self.safety_controller.resource_limits.max_operations_per_minute = 1
+
+        # First operation should pass
+        self.assertTrue(self.safety_controller.check_resource_limits(self.test_task))
+        self.safety_controller.operations_count = 1
+
+        # Second operation should fail
+        self.assertFalse(self.safety_controller.check_resource_limits(self.test_task))
+
     def test_rollback_point_creation(self):
         """Test rollback point creation"""
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            mock_doc = Mock()
-            mock_doc.Name = "TestDoc"
-            mock_doc.Objects = [Mock(Name=f"Obj{i}") for i in range(3)]
-            mock_app.ActiveDocument = mock_doc
+        mock_doc = SimpleNamespace(Name="TestDoc", Objects=list(self._mock_objects))
+        self.mock_app.ActiveDocument = mock_doc
 
-            rollback_id = self.safety_controller.setup_rollback_point(
-                "test_operation", {"test": "context"}
-            )
+        rollback_id = self.safety_controller.setup_rollback_point(
+            "test_operation", {"test": "context"}
+        )
 
-            self.assertIsNotNone(rollback_id)
-            self.assertIn(rollback_id, self.safety_controller.rollback_states)
+        self.assertIsNotNone(rollback_id)
+        self.assertIn(rollback_id, self.safety_controller.rollback_states)
 
-            state = self.safety_controller.rollback_states[rollback_id]
-            self.assertEqual(state["operation_id"], "test_operation")
-            self.assertEqual(state["object_count"], 3)
+        state = self.safety_controller.rollback_states[rollback_id]
+        self.assertEqual(state["operation_id"], "test_operation")
+        self.assertEqual(state["object_count"], 3)
 
     def test_rollback_execution(self):
         """Test rollback execution"""
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            # Setup initial state
-            mock_doc = Mock()
-            mock_doc.Name = "TestDoc"
-            initial_objects = [Mock(Name=f"Obj{i}") for i in range(3)]
-            mock_doc.Objects = initial_objects
-            mock_app.ActiveDocument = mock_doc
-
-            # Create rollback point
-            rollback_id = self.safety_controller.setup_rollback_point("test_op", {})
-
-            # Simulate adding objects
-            new_objects = initial_objects + [Mock(Name="NewObj")]
-            mock_doc.Objects = new_objects
-
-            # Mock removeObject method
-            removed_objects = []
+        # Setup initial state
+        # Stub document; rollback reads Objects and calls removeObject/recompute
+        removed_objects = []
+        initial_objects = list(self._mock_objects)
+        mock_doc = SimpleNamespace(
+            Name="TestDoc",
+            Objects=initial_objects,
+            removeObject=removed_objects.append,
+            recompute=lambda: None,
+        )
+        self.mock_app.ActiveDocument = mock_doc
 
-            def mock_remove(name):
-                removed_objects.append(name)
+        # Create rollback point
+        rollback_id = self.safety_controller.setup_rollback_point("test_op", {})
 
-            mock_doc.removeObject = mock_remove
+        # Simulate adding objects
+        mock_doc.Objects = initial_objects + [SimpleNamespace(Name="NewObj")]
 
-            # Execute rollback
-            success = self.safety_controller.execute_rollback(rollback_id)
+        # Execute rollback
+        success = self.safety_controller.execute_rollback(rollback_id)
 
-            self.assertTrue(success)
-            self.assertIn("NewObj", removed_objects)
+        self.assertTrue(success)
+        self.assertIn("NewObj", removed_objects)
 
     def test_manual_override_controls(self):
         """Test manual override functionality"""
@@ -187,81 +276,21 @@ class TestAgentSafetyController(unittest.TestCase):
         self.assertTrue(self.safety_controller.is_operation_allowed())
         self.assertFalse(self.safety_controller.manual_control)
 
-    def test_operation_preview(self):
-        """Test operation preview generation"""
-        preview = self.safety_controller.create_operation_preview(self.test_task)
-
-        self.assertIsInstance(preview, dict)
-        self.assertEqual(preview["task_id"], self.test_task.id)
-        self.assertEqual(preview["operation"], self.test_task.task_type.value)
-        self.assertTrue(preview["preview_mode"])
-        self.assertIn("timestamp", preview)
-
-    def test_safety_status(self):
-        """Test safety status reporting"""
+    def test_safety_status_reflects_current_state(self):
+        """Test each status call is a fresh dict built from the current state"""
         status = self.safety_controller.get_safety_status()
+        status["paused"] = True
+        self.assertFalse(self.safety_controller.get_safety_status()["paused"])
 
-        self.assertIsInstance(status, dict)
-        self.assertIn("safety_level", status)
-        self.assertIn("paused", status)
-        self.assertIn("manual_control", status)
-        self.assertIn("resource_limits", status)
-
-        self.assertEqual(status["safety_level"], SafetyLevel.MEDIUM.value)
-        self.assertFalse(status["paused"])
-        self.assertFalse(status["manual_control"])
-
-    def test_parameter_validation_constraint(self):
-        """Test parameter validation safety constraint"""
-        # Valid box parameters
-        valid_task = AgentTask(
-            id="valid_box",
-            task_type=TaskType.GEOMETRY_CREATION,
-            description="Create box",
-            parameters={"length": 10, "width": 20, "height": 30},
-            context={},
-        )
+        # Direct attribute writes show up as well as the pause/resume methods
+        self.safety_controller.paused = True
+        self.assertTrue(self.safety_controller.get_safety_status()["paused"])
 
-        # Invalid box parameters (missing height)
-        invalid_task = AgentTask(
-            id="invalid_box",
-            task_type=TaskType.GEOMETRY_CREATION,
-            description="Create box",
-            parameters={"length": 10, "width": 20},
-            context={},
+        self.safety_controller.operations_count = 7
+        self.assertEqual(
+            self.safety_controller.get_safety_status()["operations_count"], 7
         )
 
-        with patch("freecad_ai_addon.agent.safety_control.App") as mock_app:
-            mock_app.ActiveDocument = Mock()
-
-            # Valid task should pass
-            result_valid = self.safety_controller.validate_operation(valid_task)
-            # Should not fail on parameter validation
-
-            # Invalid task should fail
-            result_invalid = self.safety_controller.validate_operation(invalid_task)
-            # Should fail on parameter validation
-
-    def test_safety_level_escalation(self):
-        """Test different safety levels"""
-        # Test CRITICAL safety level
-        critical_controller = AgentSafetyController(SafetyLevel.CRITICAL)
-
-        safety_result = SafetyCheckResult(
-            passed=True, risk_level=OperationRisk.LOW_RISK
-        )
-
-        with patch("freecad_ai_addon.agent.safety_control.Gui") as mock_gui:
-            with patch("freecad_ai_addon.agent.safety_control.QDialog", None):
-                # Even low-risk operations should require confirmation at CRITICAL level
-                # But without GUI, should be denied
-                confirmed = critical_controller.require_user_confirmation(
-                    self.test_task, safety_result
-                )
-
-                # Without GUI, critical level should deny operations
-                self.assertFalse(confirmed)
-
 
 class TestSafetyIntegration(unittest.TestCase):
     """Test integration with agents"""
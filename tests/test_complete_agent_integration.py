@@ -127,9 +127,9 @@ class TestCompleteAgentIntegration(unittest.TestCase):
             "Create a sketch with a 50mm circle",
         ]
 
-        for request in test_requests:
-            # Test validation
-            validation = self.framework.validate_request(request)
+        # Validate all requests in one batch, then check each result
+        validations = list(map(self.framework.validate_request, test_requests))
+        for request, validation in zip(test_requests, validations):
             self.assertIn("feasible", validation)
 
             # Most basic geometric requests should be feasible
@@ -2,7 +2,9 @@
 Test suite for configuration management
 """
 
+import os
 import pytest
+import stat
 import tempfile
 from pathlib import Path
 from freecad_ai_addon.utils.config import ConfigManager
@@ -33,6 +35,13 @@ class TestConfigManager:
         assert config["ui"]["theme"] == "auto"
         assert config["agent"]["safety_mode"] is True
 
+    def test_default_config_copies_are_independent(self):
+        """Test mutating one default config copy does not leak into the next"""
+        config = self.config_manager._get_default_config()
+        config["ui"]["theme"] = "dark"
+
+        assert self.config_manager._get_default_config()["ui"]["theme"] == "auto"
+
     def test_get_config_value(self):
         """Test getting configuration values"""
         # Test simple key
@@ -57,6 +66,39 @@ class TestConfigManager:
         self.config_manager.set("ui.new_setting", True)
         assert self.config_manager.get("ui.new_setting") is True
 
+    def test_get_cache_invalidated_on_set(self):
+        """Test cached lookups see later set() and reset calls"""
+        assert self.config_manager.get("ui.theme") == "auto"
+        assert self.config_manager.get("cache.missing", 1) == 1
+        assert self.config_manager.get("cache.missing", 2) == 2
+
+        self.config_manager.set("ui.theme", "dark")
+        self.config_manager.set("cache.missing", "present")
+        assert self.config_manager.get("ui.theme") == "dark"
+        assert self.config_manager.get("cache.missing", 1) == "present"
+
+        self.config_manager.reset_to_defaults()
+        assert self.config_manager.get("ui.theme") == "auto"
+        assert self.config_manager.get("cache.missing") is None
+
+    def test_batch_update_saves_once(self):
+        """Test batch_update applies all values with a single write"""
+        from unittest.mock import patch
+
+        with patch.object(
+            self.config_manager,
+            "_save_config",
+            wraps=self.config_manager._save_config,
+        ) as save:
+            self.config_manager.batch_update(
+                {"ui.theme": "dark", "mcp.timeout": 60, "batch.new": 1}
+            )
+
+        assert save.call_count == 1
+        assert self.config_manager.get("ui.theme") == "dark"
+        assert self.config_manager.get("mcp.timeout") == 60
+        assert self.config_manager.get("batch.new") == 1
+
     def test_config_persistence(self):
         """Test that configuration persists to file"""
         # Set a value
@@ -71,6 +113,34 @@ class TestConfigManager:
         # Check that value persisted
         assert new_config_manager.get("test.persistence") == "persistent_value"
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_save_keeps_existing_file_mode(self):
+        """Test saving keeps the config file's permissions"""
+        self.config_manager.set("test.mode", 1)
+        self.config_manager.config_file.chmod(0o600)
+
+        self.config_manager.set("test.mode", 2)
+
+        assert stat.S_IMODE(self.config_manager.config_file.stat().st_mode) == 0o600
+
+    def test_failed_save_removes_temp_file(self):
+        """Test a failed save leaves no config.json.tmp behind"""
+        from unittest.mock import patch
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            self.config_manager.set("test.failure", True)
+
+        assert not (self.temp_dir / "config.json.tmp").exists()
+        assert not self.config_manager.config_file.exists()
+
+    def test_instances_are_not_registered_at_exit(self):
+        """Test only the shared manager is flushed at exit, not every instance"""
+        from unittest.mock import patch
+
+        with patch("atexit.register") as register:
+            ConfigManager()
+            register.assert_not_called()
+
     def test_export_import_config(self):
         """Test configuration export and import"""
         # Set some test values
@@ -92,6 +162,17 @@ class TestConfigManager:
         assert self.config_manager.get("export.test1") == "value1"
         assert self.config_manager.get("export.test2") == "value2"
 
+    def test_import_config_merges_nested_sections(self):
+        """Test importing a partial section keeps the other keys in it"""
+        import json
+
+        import_file = self.temp_dir / "partial.json"
+        import_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+
+        assert self.config_manager.import_config(str(import_file))
+        assert self.config_manager.get("ui.theme") == "dark"
+        assert self.config_manager.get("ui.conversation_history_limit") == 100
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -4,9 +4,7 @@ from unittest.mock import Mock, patch
 
 
 @patch("freecad_ai_addon.agent.geometry_agent.App")
-def test_extrude_from_sketch_mock(mock_app):
-    from freecad_ai_addon.agent.geometry_agent import GeometryAgent
-
+def test_extrude_from_sketch_mock(mock_app, geometry_agent):
     mock_doc = Mock()
     mock_sketch = Mock()
     mock_sketch.TypeId = "Sketcher::SketchObject"  # triggers PartDesign path first
@@ -34,19 +32,16 @@ def test_extrude_from_sketch_mock(mock_app):
 
     mock_doc.addObject.side_effect = add_object_side_effect
 
-    agent = GeometryAgent()
     params = {"operation": "extrude_from_sketch", "sketch": "Sketch001", "length": 15.0}
     task = type("T", (), {"parameters": params})
-    result = agent.execute_task(task)
+    result = geometry_agent.execute_task(task)
     assert result.status.name == "COMPLETED"
     assert result.result_data["length"] == 15.0
     assert result.result_data["volume"] == 123.4
 
 
 @patch("freecad_ai_addon.agent.geometry_agent.App")
-def test_pocket_from_sketch_mock(mock_app):
-    from freecad_ai_addon.agent.geometry_agent import GeometryAgent
-
+def test_pocket_from_sketch_mock(mock_app, geometry_agent):
     mock_doc = Mock()
     mock_sketch = Mock()
     mock_base = Mock()
@@ -76,7 +71,6 @@ def test_pocket_from_sketch_mock(mock_app):
 
     mock_doc.addObject.side_effect = add_object_side_effect
 
-    agent = GeometryAgent()
     params = {
         "operation": "pocket_from_sketch",
         "sketch": "Sketch001",
@@ -84,16 +78,14 @@ def test_pocket_from_sketch_mock(mock_app):
         "base_object": "BaseObj",
     }
     task = type("T", (), {"parameters": params})
-    result = agent.execute_task(task)
+    result = geometry_agent.execute_task(task)
     assert result.status.name == "COMPLETED"
     assert result.result_data["depth"] == 5.0
     assert result.result_data["volume"] == 80.0
 
 
 @patch("freecad_ai_addon.agent.geometry_agent.App")
-def test_loft_profiles_mock(mock_app):
-    from freecad_ai_addon.agent.geometry_agent import GeometryAgent
-
+def test_loft_profiles_mock(mock_app, geometry_agent):
     mock_doc = Mock()
     mock_prof1 = Mock()
     mock_prof2 = Mock()
@@ -119,23 +111,20 @@ def test_loft_profiles_mock(mock_app):
 
     mock_doc.addObject.side_effect = add_object_side_effect
 
-    agent = GeometryAgent()
     params = {
         "operation": "loft_profiles",
         "profiles": ["ProfA", "ProfB"],
         "solid": True,
     }
     task = type("T", (), {"parameters": params})
-    result = agent.execute_task(task)
+    result = geometry_agent.execute_task(task)
     assert result.status.name == "COMPLETED"
     assert result.result_data["profiles"] == ["ProfA", "ProfB"]
     assert result.result_data["volume"] == 200.0
 
 
 @patch("freecad_ai_addon.agent.geometry_agent.App")
-def test_sweep_profile_mock(mock_app):
-    from freecad_ai_addon.agent.geometry_agent import GeometryAgent
-
+def test_sweep_profile_mock(mock_app, geometry_agent):
     mock_doc = Mock()
     mock_profile = Mock()
     mock_path = Mock()
@@ -161,10 +150,9 @@ def test_sweep_profile_mock(mock_app):
 
     mock_doc.addObject.side_effect = add_object_side_effect
 
-    agent = GeometryAgent()
     params = {"operation": "sweep_profile", "profile": "Prof", "path": "Path"}
     task = type("T", (), {"parameters": params})
-    result = agent.execute_task(task)
+    result = geometry_agent.execute_task(task)
     assert result.status.name == "COMPLETED"
     assert result.result_data["profile"] == "Prof"
     assert result.result_data["path"] == "Path"
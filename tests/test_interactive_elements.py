@@ -0,0 +1,45 @@
+"""
+Tests for the range-hint parser of the interactive code elements
+"""
+
+import pytest
+
+# The module needs one of the Qt bindings FreeCAD ships
+interactive_elements = pytest.importorskip("freecad_ai_addon.ui.interactive_elements")
+_parse_range = interactive_elements._parse_range
+
+
+@pytest.mark.parametrize(
+    "range_str, expected",
+    [
+        ("min=0, max=10, step=0.5", {"min": 0, "max": 10, "step": 0.5}),
+        ("min=-5, max=5", {"min": -5, "max": 5}),
+        ("choices=('a', 'b')", {"choices": ("a", "b")}),
+        ("", {}),
+    ],
+)
+def test_parse_range_accepts_literal_hints(range_str, expected):
+    """Test well-formed keyword hints parse to the matching dict"""
+    assert _parse_range(range_str) == expected
+
+
+@pytest.mark.parametrize(
+    "range_str",
+    [
+        "__import__('os').system('echo hi')",
+        "min=__import__('os').getcwd()",
+        "min=open('/etc/passwd')",
+        "min=App.ActiveDocument",
+        "min=(1).__class__",
+        "**{'min': 0}",
+        "min=0), print('injected'",
+        "min=0, min=5",
+        "min={[1]: 2}",
+        "choices={1, [2]}",
+    ],
+)
+def test_parse_range_rejects_non_literals(range_str):
+    """Test calls, attribute access, imports, repeated keys and unhashable
+    literals are refused"""
+    with pytest.raises((ValueError, SyntaxError)):
+        _parse_range(range_str)
@@ -10,6 +10,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from freecad_ai_addon.utils import security
 from freecad_ai_addon.utils.security import CredentialManager
 from freecad_ai_addon.core.provider_status import (
     ProviderMonitor,
@@ -25,7 +26,17 @@ class TestProviderManagementSystem:
     def setup_method(self):
         """Set up test environment"""
         self.temp_dir = Path(tempfile.mkdtemp())
-        self.credential_manager = CredentialManager(config_dir=self.temp_dir)
+        # Snapshot the global default so teardown can put it back
+        self._default_patches = (
+            patch.object(security, "_credential_manager", security._credential_manager),
+            patch.dict(security._managers),
+        )
+        for default_patch in self._default_patches:
+            default_patch.start()
+        # The monitor looks the manager up via get_credential_manager()
+        self.credential_manager = CredentialManager(
+            config_dir=self.temp_dir
+        ).install_as_default()
         self.provider_monitor = ProviderMonitor()
         self.connection_manager = ConnectionManager()
 
@@ -33,6 +44,8 @@ class TestProviderManagementSystem:
         """Clean up test environment"""
         import shutil
 
+        for default_patch in self._default_patches:
+            default_patch.stop()
         shutil.rmtree(self.temp_dir)
 
     def test_credential_storage_integration(self):
@@ -289,6 +302,68 @@ class TestProviderManagementSystem:
         # Unregister callback
         self.provider_monitor.unregister_status_callback("openai", status_callback)
 
+    @pytest.mark.asyncio
+    async def test_status_callbacks_do_not_keep_subscribers_alive(self):
+        """Test bound-method callbacks are dropped once their owner is collected"""
+        import gc
+
+        class Subscriber:
+            def __init__(self):
+                self.events = []
+
+            def on_status(self, health):
+                self.events.append(health.status)
+
+        subscriber = Subscriber()
+        self.provider_monitor.register_status_callback("ollama", subscriber.on_status)
+        health = self.provider_monitor.get_provider_status("ollama")
+
+        await self.provider_monitor._notify_status_callbacks("ollama", health)
+        assert subscriber.events == [ProviderStatus.UNKNOWN]
+
+        del subscriber
+        gc.collect()
+        await self.provider_monitor._notify_status_callbacks("ollama", health)
+        assert self.provider_monitor._status_callbacks["ollama"] == []
+
+    def test_adaptive_monitoring_interval(self):
+        """Test monitoring interval tightens on errors and backs off when stable"""
+
+        def health(status):
+            return ProviderHealth(
+                status=status,
+                last_check=0,
+                response_time=None,
+                error_message=None,
+                rate_limit_remaining=None,
+                rate_limit_reset=None,
+                usage_stats={},
+            )
+
+        monitor = self.provider_monitor
+        connected = [health(ProviderStatus.CONNECTED)]
+
+        # A failure switches to the shortest interval
+        stable = monitor._adapt_interval(
+            [health(ProviderStatus.RATE_LIMITED)], 2, 30.0, 5.0, 120.0
+        )
+        assert stable == 0
+        assert monitor._interval == 5.0
+
+        # Recovery returns to the base interval, then backs off after 3 cycles
+        stable = monitor._adapt_interval(connected, stable, 30.0, 5.0, 120.0)
+        assert monitor._interval == 30.0
+        stable = monitor._adapt_interval(connected, stable, 30.0, 5.0, 120.0)
+        stable = monitor._adapt_interval(connected, stable, 30.0, 5.0, 120.0)
+        assert monitor._interval == 60.0
+        for _ in range(3):
+            stable = monitor._adapt_interval(connected, stable, 30.0, 5.0, 120.0)
+        assert monitor._interval == 120.0
+
+        # Exceptions from the gather count as failures
+        monitor._adapt_interval([RuntimeError("boom")], stable, 30.0, 5.0, 120.0)
+        assert monitor._interval == 5.0
+
     def test_integration_provider_lifecycle(self):
         """Test complete provider lifecycle"""
         provider = "openai"
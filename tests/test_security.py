@@ -2,10 +2,13 @@
 Tests for secure credential storage functionality
 """
 
+import json
+import os
 import tempfile
 import pytest
 from pathlib import Path
-from freecad_ai_addon.utils.security import CredentialManager
+from cryptography.fernet import Fernet
+from freecad_ai_addon.utils.security import CredentialManager, get_credential_manager
 
 
 class TestCredentialManager:
@@ -101,6 +104,196 @@ class TestCredentialManager:
         # Non-existent credential
         assert not self.manager.validate_credential("nonexistent", "api_key")
 
+    def test_get_all_with_validity(self):
+        """Test batched validation matches per-type validation"""
+        self.manager.store_credential("openai", "api_key", "short")
+        self.manager.store_credential("openai", "org_id", "org-test123")
+
+        validity = self.manager.get_all_with_validity("openai")
+        assert validity == {"api_key": False, "org_id": True}
+        for cred_type, is_valid in validity.items():
+            assert self.manager.validate_credential("openai", cred_type) == is_valid
+        assert self.manager.get_all_with_validity("nonexistent") == {}
+
+    def test_validate_all(self):
+        """Test batch validation agrees with validate_credential"""
+        self.manager.store_credential("openai", "api_key", "sk-test123456789")
+        self.manager.store_credential("anthropic", "api_key", "short")
+
+        requested = {
+            "openai": ["api_key", "org_id"],
+            "anthropic": ["api_key"],
+            "missing": ["api_key"],
+        }
+        results = self.manager.validate_all(requested)
+        assert results == {
+            "openai": {"api_key": True, "org_id": False},
+            "anthropic": {"api_key": False},
+            "missing": {"api_key": False},
+        }
+        for provider, cred_types in requested.items():
+            for cred_type in cred_types:
+                assert results[provider][cred_type] == (
+                    self.manager.validate_credential(provider, cred_type)
+                )
+
+    def test_decrypted_credentials_are_cached(self):
+        """Test repeat reads skip decryption but see writes from other managers"""
+        from unittest.mock import patch
+
+        self.manager.store_credential("openai", "api_key", "sk-cached-key")
+
+        with patch.object(
+            self.manager, "_decrypt", wraps=self.manager._decrypt
+        ) as decrypt:
+            assert self.manager.get_credential("openai", "api_key") == "sk-cached-key"
+            assert self.manager.list_providers() == ["openai"]
+            decrypt.assert_not_called()
+
+        other = CredentialManager(config_dir=self.temp_dir)
+        other.store_credential("anthropic", "api_key", "sk-ant-other-manager-key")
+        assert sorted(self.manager.list_providers()) == ["anthropic", "openai"]
+
+    def test_cache_sees_same_length_overwrite(self):
+        """Test a same-size rewrite by another manager is never served stale"""
+        other = CredentialManager(config_dir=self.temp_dir)
+
+        for i in range(20):
+            writer, reader = (other, self.manager) if i % 2 else (self.manager, other)
+            value = f"sk-same-length-{i:04d}"
+            assert writer.store_credential("openai", "api_key", value)
+            assert reader.get_credential("openai", "api_key") == value
+            assert writer.get_credential("openai", "api_key") == value
+
+    def test_reads_legacy_fernet_files(self):
+        """Test credentials written in the old Fernet format still load"""
+
+        token = self.manager._legacy_cipher.encrypt(
+            json.dumps({"openai": {"api_key": "sk-legacy-key"}}).encode("utf-8")
+        )
+        self.manager.credentials_file.write_bytes(token)
+
+        assert self.manager.get_credential("openai", "api_key") == "sk-legacy-key"
+
+        # The next write switches the file to the AES-GCM format
+        self.manager.store_credential("openai", "org_id", "org-legacy")
+        assert self.manager.credentials_file.read_bytes()[:1] == b"\x02"
+        new_manager = CredentialManager(config_dir=self.temp_dir)
+        assert new_manager.get_credential("openai", "api_key") == "sk-legacy-key"
+
+    def test_migrates_pbkdf2_encrypted_files(self):
+        """Test files written under the old PBKDF2 key are re-encrypted"""
+
+        legacy_key = self.manager._derive_legacy_key()
+        assert legacy_key != self.manager._key
+        token = Fernet(legacy_key).encrypt(
+            json.dumps({"openai": {"api_key": "sk-pbkdf2-key"}}).encode("utf-8")
+        )
+        self.manager.credentials_file.write_bytes(token)
+
+        # Migration is triggered by the failed decrypt, on any manager
+        assert self.manager.get_credential("openai", "api_key") == "sk-pbkdf2-key"
+        new_manager = CredentialManager(config_dir=self.temp_dir)
+        assert new_manager.get_credential("openai", "api_key") == "sk-pbkdf2-key"
+        # The file now decrypts with the current key alone
+        assert json.loads(
+            new_manager._decrypt(new_manager.credentials_file.read_bytes())
+        )
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_private_files_created_owner_only(self):
+        """Test salt and credentials are created with 0o600"""
+        self.manager.store_credential("openai", "api_key", "sk-permissions")
+        assert self.manager.change_encryption_key()
+
+        for name in ("salt.key", "credentials.enc"):
+            assert (self.temp_dir / name).stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_export_tightens_existing_file_permissions(self):
+        """Test exporting over a world-readable file makes it owner-only"""
+        self.manager.store_credential("openai", "api_key", "sk-export-perms")
+        export_file = self.temp_dir / "backup.enc"
+        export_file.write_bytes(b"old backup")
+        export_file.chmod(0o644)
+
+        assert self.manager.export_credentials(str(export_file))
+        assert export_file.stat().st_mode & 0o777 == 0o600
+
+    def test_unchanged_save_skips_write(self):
+        """Test re-storing identical credentials does not rewrite the file"""
+        from unittest.mock import patch
+
+        self.manager.store_credential("openai", "api_key", "sk-unchanged-key")
+        with patch.object(
+            self.manager, "_encrypt", wraps=self.manager._encrypt
+        ) as encrypt:
+            self.manager.store_credential("openai", "api_key", "sk-unchanged-key")
+            encrypt.assert_not_called()
+            self.manager.store_credential("openai", "api_key", "sk-changed-key")
+            assert encrypt.call_count == 1
+
+        new_manager = CredentialManager(config_dir=self.temp_dir)
+        assert new_manager.get_credential("openai", "api_key") == "sk-changed-key"
+
+    def test_failed_save_keeps_previous_file(self):
+        """Test an interrupted save leaves the old credentials intact"""
+        from unittest.mock import patch
+
+        self.manager.store_credential("openai", "api_key", "sk-original-key")
+        with patch("os.replace", side_effect=OSError("disk full")):
+            assert not self.manager.store_credential("openai", "api_key", "sk-new-key")
+
+        assert not (self.temp_dir / "credentials.enc.tmp").exists()
+        new_manager = CredentialManager(config_dir=self.temp_dir)
+        assert new_manager.get_credential("openai", "api_key") == "sk-original-key"
+
+    def test_batch_update_writes_once(self):
+        """Test mutations inside batch_update are written with one save"""
+        from unittest.mock import patch
+
+        with patch.object(
+            self.manager, "_encrypt", wraps=self.manager._encrypt
+        ) as encrypt:
+            with self.manager.batch_update():
+                self.manager.store_credential("openai", "api_key", "sk-batch-key")
+                self.manager.store_credential("openai", "org_id", "org-batch")
+                self.manager.remove_credential("openai", "org_id")
+                assert self.manager.get_credential("openai", "api_key") == (
+                    "sk-batch-key"
+                )
+                encrypt.assert_not_called()
+            assert encrypt.call_count == 1
+
+        new_manager = CredentialManager(config_dir=self.temp_dir)
+        assert new_manager.get_credential("openai", "api_key") == "sk-batch-key"
+        assert new_manager.list_credential_types("openai") == ["api_key"]
+
+    def test_batch_update_discards_on_error(self):
+        """Test a failing batch leaves the stored credentials untouched"""
+        self.manager.store_credential("openai", "api_key", "sk-original-key")
+
+        with pytest.raises(RuntimeError):
+            with self.manager.batch_update():
+                self.manager.store_credential("openai", "api_key", "sk-staged-key")
+                raise RuntimeError("boom")
+
+        assert self.manager.get_credential("openai", "api_key") == "sk-original-key"
+
+    def test_get_credential_manager_shares_one_manager_per_dir(self):
+        """Test get_credential_manager reuses managers and ignores construction"""
+        shared = get_credential_manager(self.temp_dir)
+        assert get_credential_manager(self.temp_dir) is shared
+        assert get_credential_manager(str(self.temp_dir)) is shared
+
+        assert self.manager.install_as_default() is self.manager
+        assert get_credential_manager() is self.manager
+        assert get_credential_manager(self.temp_dir) is self.manager
+
+        # Constructing a manager no longer replaces the default
+        CredentialManager(config_dir=self.temp_dir)
+        assert get_credential_manager() is self.manager
+
     def test_encryption_persistence(self):
         """Test that credentials survive manager recreation"""
         provider = "test_provider"
@@ -126,6 +319,9 @@ class TestCredentialManager:
         # Export credentials
         export_file = self.temp_dir / "backup.enc"
         assert self.manager.export_credentials(str(export_file))
+        exported = json.loads(self.manager._decrypt(export_file.read_bytes()))
+        assert exported["version"] == "1.0"
+        assert sorted(exported["credentials"]) == ["anthropic", "openai"]
 
         # Clear current credentials
         self.manager.remove_credential("openai")
@@ -141,6 +337,27 @@ class TestCredentialManager:
             self.manager.get_credential("anthropic", "api_key") == "test_anthropic_key"
         )
 
+    def test_credential_cache_invalidated_on_write(self):
+        """Test cached lookups skip decryption until the store changes"""
+        from unittest.mock import patch
+        from freecad_ai_addon.utils import credential_cache
+
+        self.manager.install_as_default()
+        credential_cache.cache_clear()
+        self.manager.store_credential("openai", "api_key", "sk-first-key")
+        assert credential_cache.cached_validate("openai", "api_key")
+        assert credential_cache.cached_list_providers() == ["openai"]
+
+        with patch.object(self.manager, "_load_encrypted_data") as load:
+            assert credential_cache.cached_validate("openai", "api_key")
+            assert credential_cache.cached_list_providers() == ["openai"]
+            load.assert_not_called()
+
+        self.manager.remove_credential("openai")
+        assert not credential_cache.cached_validate("openai", "api_key")
+        assert credential_cache.cached_list_providers() == []
+        credential_cache.cache_clear()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])